@@ -3,6 +3,107 @@ import json
 import os
 import re
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Directory that receives the JSON and every generated format
+_OUTPUT_DIR = os.path.join('preprocessed_data', 'self-repoted-mental-health-college-students-2022')
+
+# Number of respondents rendered per write call in the format converters
+_WRITE_BATCH = 128
+
+# Short answer keys for grouped questions; the legend is stored in the JSON under schema.groups
+_GROUP_SHORT = {
+    "Parental Education": "PE",
+    "Emotional Regulation Frequency": "ERF",
+    "Anxiety Symptoms Frequency": "ASF",
+    "Depressive Symptoms Frequency": "DSF"
+}
+
+# Precompiled patterns for parsing question type annotations
+_QUESTION_TYPE_RE = re.compile(r'\[(?P<type>[^\]]*?(?:Likert (?P<start>\d+)[–-](?P<end>\d+)[^\]]*)?)\]')
+_MCQ_RE = re.compile(r'MCQ: (.+)')
+_MCQ_NUMBER_RE = re.compile(r'(?:^|\s+)(\d+)\.\s')
+_LIKERT_LABELED_RE = re.compile(r'Likert (\d+)–(\d+): (.+)')
+_LIKERT_SIMPLE_RE = re.compile(r'Likert (\d+)–(\d+)')
+_TABS_RE = re.compile(r'\t+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Shortened question texts used in place of the full metadata text
+_XML_QUESTION_TEXT = {
+    "Parental Education": "Years of education of your parents",
+    "Emotional Regulation Frequency": "Emotional regulation last month",
+    "Anxiety Symptoms Frequency": "Anxiety symptoms past 2 weeks",
+    "Depressive Symptoms Frequency": "Depressive symptoms past 2 weeks",
+    "Year of birth": "What is your date of birth?",
+    "Gender": "What is your gender?",
+    "Socio-economic status": "Socio-economic status of your home",
+    "Ethnic identity": "Ethnic identity",
+    "Life satisfaction": "Life satisfaction",
+    "Happiness": "Happiness yesterday",
+    "Laughter": "Laughter yesterday",
+    "Learning": "Learning yesterday",
+    "Enjoyment": "Enjoyment yesterday",
+    "Worry": "Worry yesterday",
+    "Depression": "Depression yesterday",
+    "Anger": "Anger yesterday",
+    "Stress": "Stress yesterday",
+    "Loneliness": "Loneliness yesterday"
+}
+_TXT_QUESTION_TEXT = {
+    "Parental Education": "Years of education of your parents",
+    "Emotional Regulation Frequency": "Emotional Regulation Frequency",
+    "Anxiety Symptoms Frequency": "Anxiety Symptoms Frequency",
+    "Depressive Symptoms Frequency": "Depressive Symptoms Frequency",
+    "Year of birth": "What is your date of birth?",
+    "Gender": "What is your gender?",
+    "Socio-economic status": "What is the socio-economic status of your home?",
+    "Ethnic identity": "You are or are recognized as:",
+    "Life satisfaction": "In general, how satisfied are you with life?",
+    "Happiness": "How happy did you feel yesterday?",
+    "Laughter": "How much did you laugh yesterday?",
+    "Learning": "Did you learn new or exciting things yesterday?",
+    "Enjoyment": "How much did you enjoy activities yesterday?",
+    "Worry": "How worried did you feel yesterday?",
+    "Depression": "How depressed did you feel yesterday?",
+    "Anger": "How angry did you feel yesterday?",
+    "Stress": "How much stress did you feel yesterday?",
+    "Loneliness": "How lonely did you feel yesterday?"
+}
+
+# XML element names for the sub-questions of each grouped question
+_XML_SUB_KEYS = {
+    "Emotional Regulation Frequency": {
+        "Upset by Unexpected Events": "unexpectedEvents",
+        "Unable to Control Important Things": "controlImportantThings",
+        "Lacked Confidence Handling Problems": "confidence",
+        "Unable to Cope": "unableToCope",
+        "Irritated by Life": "irritated",
+        "On Top of Things": "onTop"
+    },
+    "Anxiety Symptoms Frequency": {
+        "Feeling Nervous or On Edge": "nervous",
+        "Trouble Relaxing": "relaxing",
+        "Restlessness": "restlessness",
+        "Irritability": "irritability",
+        "Fear Something Awful Might Happen": "fear"
+    },
+    "Depressive Symptoms Frequency": {
+        "Anhedonia": "anhedonia",
+        "Sleep Problems": "sleepProblems",
+        "Fatigue": "fatigue",
+        "Appetite Changes": "appetite",
+        "Feelings of Worthlessness": "worthlessness",
+        "Concentration Difficulties": "concentration",
+        "Suicidal Thoughts": "suicidalThoughts"
+    }
+}
 
 def clean_text(text):
     """Clean text by removing tabs and extra whitespace"""
@@ -10,8 +111,8 @@ def clean_text(text):
         return None
     if isinstance(text, str):
         # Remove tabs and normalize whitespace
-        text = re.sub(r'\t+', ' ', str(text))
-        text = re.sub(r'\s+', ' ', text)
+        text = _TABS_RE.sub(' ', str(text))
+        text = _WHITESPACE_RE.sub(' ', text)
         return text.strip()
     return text
 
@@ -82,6 +183,34 @@ def get_question_metadata():
         }
     }
 
+def get_group_codes(data):
+    """Return the group name -> short answer key legend stored in the JSON data"""
+    return data.get('schema', {}).get('groups', {})
+
+def get_group_names(data):
+    """Return the short answer key -> group name mapping for decoding answers"""
+    return {code: name for name, code in get_group_codes(data).items()}
+
+@lru_cache(maxsize=None)
+def to_camel_case(text):
+    """Convert a question key to a camelCase XML identifier; memoized as the set of keys is small and fixed"""
+    words = text.replace("-", " ").replace("_", " ").split()
+    return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
+
+def split_mcq_options(opts):
+    """Split an MCQ option list like '1. Male 2. Female' into (number, label) pairs in one pass"""
+    # The captured numbers alternate with the option labels: ['', '1', 'Male', '2', 'Female']
+    parts = _MCQ_NUMBER_RE.split(opts)
+    return list(zip(parts[1::2], parts[2::2]))
+
+def parse_question_text(text):
+    """Split a question into its text, bracketed type annotation and Likert scale in a single scan"""
+    m = _QUESTION_TYPE_RE.search(text)
+    if not m:
+        return text.strip(), "", None
+    scale = f"{m['start']}-{m['end']}" if m['start'] else None
+    return (text[:m.start()] + text[m.end():]).strip(), m['type'], scale
+
 def create_column_mapping():
     """Create mapping from Excel columns to JSON structure"""
     # This mapping will need to be adjusted based on the actual Excel column names
@@ -306,18 +435,52 @@ def auto_map_columns(excel_columns):
     
     return mapping
 
+def save_parquet_cache(df, parquet_path):
+    """Write the parsed Excel data to a Parquet cache so later runs can skip the Excel parse"""
+    try:
+        cache_df = df.copy()
+        # Parquet needs a single type per column, so mixed object columns are stored as text;
+        # the float-or-text conversion in convert_excel_to_json reads them back to the same values
+        for col in cache_df.columns[cache_df.dtypes == object]:
+            cache_df[col] = cache_df[col].map(str, na_action='ignore')
+        cache_df.columns = [str(col) for col in cache_df.columns]
+        cache_df.to_parquet(parquet_path, compression='zstd')
+        print(f"✓ Parquet cache saved to: {parquet_path}")
+    except Exception as e:
+        print(f"Could not write Parquet cache: {e}")
+
+def clean_column(column):
+    """Convert a column to floats where numeric and cleaned text elsewhere, with None for empty cells"""
+    numeric = pd.to_numeric(column, errors='coerce').astype(float)
+    cleaned = numeric.astype(object).where(numeric.notna(), None)
+    
+    text = column[numeric.isna() & column.notna()].map(lambda value: clean_text(str(value)))
+    text = text[(text != '') & (text.str.lower() != 'nan')]
+    cleaned.loc[text.index] = text
+    return cleaned.to_numpy()
+
 def convert_excel_to_json():
     """Convert Excel data to JSON format with predefined structure"""
-    # Path to the Excel file
+    # Path to the Excel file and its Parquet cache
     excel_path = os.path.join('data', 'self-reported-mental-health-college-students-2022', 'Raw data.xlsx')
+    parquet_path = excel_path.replace('.xlsx', '.parquet')
     
     try:
-        print("Reading Excel file...")
-        
-        # Based on examination, the questions are in row 1 (header=1)
-        df = pd.read_excel(excel_path, header=1)
+        # Reuse the Parquet cache if it is at least as new as the Excel file
+        if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(excel_path):
+            print("Reading cached Parquet file...")
+            df = pd.read_parquet(parquet_path)
+        else:
+            print("Reading Excel file...")
+            
+            # Based on examination, the questions are in row 1 (header=1)
+            df = pd.read_excel(excel_path, header=1)
+            save_parquet_cache(df, parquet_path)
         print(f"Successfully loaded: {len(df)} rows, {len(df.columns)} columns")
         
+        # Replace NaN with None once so the row loop only needs an identity check
+        df = df.astype(object).where(df.notna(), None)
+        
         print("Excel columns:", list(df.columns)[:10])  # Show first 10 columns
         
         # Get the predefined question metadata
@@ -330,34 +493,43 @@ def convert_excel_to_json():
         for excel_col, json_key in list(column_mapping.items())[:10]:
             print(f"  {excel_col} -> {json_key}")
         
+        # Use the short group keys in the per-response answers
+        column_mapping = {
+            excel_col: (_GROUP_SHORT[json_mapping[0]], json_mapping[1]) if isinstance(json_mapping, tuple) else json_mapping
+            for excel_col, json_mapping in column_mapping.items()
+        }
+        
+        # Resolve the position of each mapped column present in the data once
+        col_positions = {col: i for i, col in enumerate(df.columns)}
+        mapped_columns = [
+            (col_positions[excel_col], json_mapping)
+            for excel_col, json_mapping in column_mapping.items()
+            if excel_col in col_positions
+        ]
+        
+        # Drop rows without any mapped answer up front; the index keeps the original row numbers
+        df = df.dropna(subset=[df.columns[position] for position, _ in mapped_columns], how='all')
+        
+        # Clean every mapped column in one vectorized pass instead of per cell
+        json_mappings = [json_mapping for _, json_mapping in mapped_columns]
+        cleaned_columns = [clean_column(df.iloc[:, position]) for position, _ in mapped_columns]
+        
         # Convert data
         data = {
+            "schema": {"groups": _GROUP_SHORT},
             "questions": question_metadata,
             "responses": []
         }
         
         print("Processing responses...")
-        for idx, (_, row) in enumerate(df.iterrows()):
+        for row_number, row in zip(df.index, zip(*cleaned_columns)):
             answers = {}
             
             # Process each mapped column
-            for excel_col, json_mapping in column_mapping.items():
-                if excel_col not in row.index:
+            for value, json_mapping in zip(row, json_mappings):
+                # Skip empty cells
+                if value is None:
                     continue
-                    
-                value = row[excel_col]
-                
-                # Clean and validate the value
-                if value is None or (isinstance(value, (int, float)) and pd.isna(value)):
-                    continue
-                    
-                # Convert to float if possible
-                try:
-                    value = float(value)
-                except:
-                    value = clean_text(str(value))
-                    if value == '' or (value is not None and str(value).lower() == 'nan'):
-                        continue
                 
                 # Map to JSON structure
                 if isinstance(json_mapping, str):
@@ -373,13 +545,13 @@ def convert_excel_to_json():
             # Only add response if it has data
             if answers:
                 response = {
-                    "respondent": str(idx + 1),
+                    "respondent": str(row_number + 1),
                     "answers": answers
                 }
                 data["responses"].append(response)
         
         # Create output directory
-        output_dir = os.path.join('preprocessed_data', 'self-repoted-mental-health-college-students-2022')
+        output_dir = _OUTPUT_DIR
         os.makedirs(output_dir, exist_ok=True)
         
         # Save to JSON file
@@ -391,7 +563,8 @@ def convert_excel_to_json():
         print(f"Total responses: {len(data['responses'])}")
         print(f"Sample response keys: {list(data['responses'][0]['answers'].keys()) if data['responses'] else 'No responses'}")
         
-        return json_path
+        # Return the in-memory data too so the format converters don't re-read the file
+        return json_path, data
         
     except FileNotFoundError:
         print(f"Error: File not found at {excel_path}")
@@ -401,518 +574,473 @@ def convert_excel_to_json():
         import traceback
         traceback.print_exc()
 
-def convert_json_to_html(json_path, output_dir):
-    """Convert JSON data to HTML format matching the specified structure"""
-    try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Start HTML content
-        html_content = "<h1>Questions</h1>\n<ul>\n"
-        
-        # Add questions section
-        for question_key, question_data in data['questions'].items():
-            if isinstance(question_data, dict):
-                # Complex question with base question and sub-questions
-                html_content += f"  <li><strong>{question_key}:</strong>\n"
-                html_content += f"    <p>{question_data['base_question']}</p>\n"
-                html_content += "    <ul>\n"
-                for sub_key, sub_question in question_data["sub_questions"].items():
-                    html_content += f"      <li>{sub_key}: {sub_question}</li>\n"
-                html_content += "    </ul>\n"
-                html_content += "  </li>\n"
-            else:
-                # Simple question
-                html_content += f"  <li><strong>{question_key}:</strong> {question_data}</li>\n"
+def load_json_data(source):
+    """Return the questionnaire data from a JSON file path, or the dict itself if already loaded"""
+    if isinstance(source, dict):
+        return source
+    if orjson is not None:
+        # orjson parses straight from bytes and is considerably faster than the json module
+        with open(source, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(source, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def write_in_batches(f, blocks):
+    """Write rendered respondent blocks, joining every _WRITE_BATCH of them into a single write"""
+    batch = []
+    for block in blocks:
+        batch.append(block)
+        if len(batch) >= _WRITE_BATCH:
+            f.write(''.join(batch))
+            batch.clear()
+    if batch:
+        f.write(''.join(batch))
+
+def remove_partial_output(path):
+    """Delete an output file left half-written by a failed conversion"""
+    if os.path.exists(path):
+        os.remove(path)
+
+def xml_text(value):
+    """Escape &, < and > in text values for XML/HTML element content; numbers pass through"""
+    return escape(value) if isinstance(value, str) else value
+
+def render_xml_answer(answer_key, answer_value):
+    """Render one answer of a respondent as XML elements"""
+    # Convert key to camelCase for XML
+    xml_key = to_camel_case(answer_key)
+    
+    if not isinstance(answer_value, dict):
+        # Simple answer
+        return f'      <{xml_key}>{xml_text(answer_value)}</{xml_key}>\n'
+    
+    # Grouped answers (like Parental Education)
+    if answer_key == "Parental Education":
+        sub_elements = [(sub_key.lower(), sub_value) for sub_key, sub_value in answer_value.items()]
+    else:
+        mapping = _XML_SUB_KEYS.get(answer_key, {})
+        sub_elements = [(mapping[sub_key], sub_value) for sub_key, sub_value in answer_value.items() if sub_key in mapping]
+    body = ''.join(f'        <{name}>{xml_text(value)}</{name}>\n' for name, value in sub_elements)
+    return f'      <{xml_key}>\n{body}      </{xml_key}>\n'
+
+def make_xml_group_renderer(xml_key, sub_names):
+    """Build a renderer for one grouped answer with its tags and sub-element names resolved up front"""
+    open_tag, close_tag = f'      <{xml_key}>\n', f'      </{xml_key}>\n'
+    sub_templates = {sub_key: f'        <{name}>{{}}</{name}>\n'.format for sub_key, name in sub_names.items()}
+    
+    def render(answer_value):
+        body = ''.join(sub_templates[sub_key](xml_text(sub_value)) for sub_key, sub_value in answer_value.items() if sub_key in sub_templates)
+        return f'{open_tag}{body}{close_tag}'
+    return render
+
+def make_xml_simple_renderer(xml_key):
+    """Build a renderer for one simple answer with its tags resolved up front"""
+    template = f'      <{xml_key}>{{}}</{xml_key}>\n'.format
+    
+    def render(answer_value):
+        return template(xml_text(answer_value))
+    return render
+
+def build_xml_answer_renderers(data):
+    """Specialize an XML renderer for every answer key of the schema, so responses need no per-answer dispatch"""
+    group_codes = get_group_codes(data)
+    renderers = {}
+    for question_key, question_data in data['questions'].items():
+        xml_key = to_camel_case(question_key)
+        answer_key = group_codes.get(question_key, question_key)
+        if not isinstance(question_data, dict):
+            renderers[answer_key] = make_xml_simple_renderer(xml_key)
+        elif question_key == "Parental Education":
+            sub_names = {sub_key: sub_key.lower() for sub_key in question_data['sub_questions']}
+            renderers[answer_key] = make_xml_group_renderer(xml_key, sub_names)
+        elif question_key in _XML_SUB_KEYS:
+            renderers[answer_key] = make_xml_group_renderer(xml_key, _XML_SUB_KEYS[question_key])
+    return renderers
+
+def render_markdown_answer(label, is_grouped, answer_value):
+    """Render one answer of a respondent as Markdown list items under its bullet label"""
+    if not is_grouped:
+        return f"{label} {answer_value}\n"
+    sub_items = ''.join(f"  - {sub_key}: {sub_value}\n" for sub_key, sub_value in answer_value.items())
+    return f"{label}\n{sub_items}"
+
+def render_html_answer(label, is_grouped, answer_value):
+    """Render one answer of a respondent as an HTML list item"""
+    if not is_grouped:
+        # Simple answer
+        return f"{label} {xml_text(answer_value)}</li>\n"
+    # Grouped answer (like Parental Education)
+    sub_items = ''.join(f"      <li>{xml_text(sub_key)}: {xml_text(sub_value)}</li>\n" for sub_key, sub_value in answer_value.items())
+    return f"{label}\n    <ul>\n{sub_items}    </ul>\n  </li>\n"
+
+def render_txt_answer(key, answer, sub_questions):
+    """Render one answer of a respondent as plain text lines"""
+    if sub_questions is None:
+        return f"- {key}: {answer}\n"
+    values = answer if isinstance(answer, dict) else {}
+    sub_items = ''.join(f"  - {subq}: {values.get(subq, '')}\n" for subq in sub_questions)
+    return f"- {key}:\n{sub_items}"
+
+def render_html_respondent(response, html_fields):
+    """Render one respondent as an HTML heading and list, marking unanswered questions as missing"""
+    answers = response['answers']
+    items = ''.join(
+        render_html_answer(label, is_grouped, answers[answer_key]) if answer_key in answers
+        else f"{label} (missing)</li>\n"
+        for answer_key, label, is_grouped in html_fields
+    )
+    return f"<h2>Respondent {response['respondent']}</h2>\n<ul>\n{items}</ul>\n\n"
+
+def render_xml_respondent(response, renderers, group_names):
+    """Render one respondent as a <respondent> element"""
+    # Keys outside the schema fall back to the generic renderer
+    answers = ''.join(
+        renderers[answer_key](answer_value) if answer_key in renderers
+        else render_xml_answer(group_names.get(answer_key, answer_key), answer_value)
+        for answer_key, answer_value in response['answers'].items()
+    )
+    return f'    <respondent id="{response["respondent"]}">\n{answers}    </respondent>\n'
+
+def render_markdown_respondent(response, md_fields):
+    """Render one respondent as a Markdown section"""
+    # Keys outside the schema fall back to checking the value itself
+    answers = ''.join(
+        render_markdown_answer(*md_fields[answer_key], answer_value) if answer_key in md_fields
+        else render_markdown_answer(f"- **{answer_key}:**", isinstance(answer_value, dict), answer_value)
+        for answer_key, answer_value in response['answers'].items()
+    )
+    return f"### Respondent {response['respondent']}\n\n{answers}\n"
+
+def render_txt_respondent(response, answer_fields):
+    """Render one respondent as a plain text block in question order"""
+    answers = response['answers']
+    body = ''.join(
+        render_txt_answer(key, answers[answer_key], sub_questions)
+        for key, answer_key, sub_questions in answer_fields
+        if answer_key in answers
+    )
+    return f"Respondent {response['respondent']}:\n{body}\n"
+
+@lru_cache(maxsize=4)
+def render_html_questions(metadata_json):
+    """Render the HTML Questions section; cached as it depends only on the question metadata"""
+    questions = json.loads(metadata_json)
+    
+    # Start HTML content
+    parts = ["<h1>Questions</h1>\n<ul>\n"]
+    
+    # Add questions section
+    for question_key, question_data in questions.items():
+        if isinstance(question_data, dict):
+            # Complex question with base question and sub-questions
+            parts.append(f"  <li><strong>{xml_text(question_key)}:</strong>\n")
+            parts.append(f"    <p>{xml_text(question_data['base_question'])}</p>\n")
+            parts.append("    <ul>\n")
+            for sub_key, sub_question in question_data["sub_questions"].items():
+                parts.append(f"      <li>{xml_text(sub_key)}: {xml_text(sub_question)}</li>\n")
+            parts.append("    </ul>\n")
+            parts.append("  </li>\n")
+        else:
+            # Simple question
+            parts.append(f"  <li><strong>{xml_text(question_key)}:</strong> {xml_text(question_data)}</li>\n")
+    
+    parts.append("</ul>\n\n")
+    return ''.join(parts)
+
+@lru_cache(maxsize=4)
+def build_question_plan(metadata_json):
+    """Parse every question's text, type, scale and MCQ options once for all output formats"""
+    questions = json.loads(metadata_json)
+    
+    plan = []
+    for question_key, question_data in questions.items():
+        is_grouped = isinstance(question_data, dict)
+        q_text, type_str, scale = parse_question_text(question_data['base_question'] if is_grouped else question_data)
+        opt_match = _MCQ_RE.search(type_str) if "MCQ" in type_str else None
+        plan.append({
+            "key": question_key,
+            "id": to_camel_case(question_key),
+            "grouped": is_grouped,
+            "text": q_text,
+            "type": type_str,
+            "scale": scale,
+            "options": split_mcq_options(opt_match.group(1)) if opt_match else None,
+            "sub_questions": tuple(question_data["sub_questions"]) if is_grouped else None
+        })
+    return plan
+
+def format_likert_label(type_str):
+    """Format a Likert type annotation as 'Likert start–end[: labels]' for the TXT output"""
+    likert_match = _LIKERT_LABELED_RE.search(type_str)
+    if likert_match:
+        start, end, labels = likert_match.groups()
+        return f"Likert {start}–{end}: {labels}"
+    # Simple Likert without labels
+    likert_simple = _LIKERT_SIMPLE_RE.search(type_str)
+    if likert_simple:
+        start, end = likert_simple.groups()
+        return f"Likert {start}–{end}"
+    return type_str
+
+@lru_cache(maxsize=4)
+def render_xml_questions(metadata_json):
+    """Render the XML questions element; cached as it depends only on the question metadata"""
+    # Add Questions section
+    parts = ['  <questions>\n']
+    
+    for question in build_question_plan(metadata_json):
+        q_id, type_str, scale = question["id"], question["type"], question["scale"]
         
-        html_content += "</ul>\n\n"
+        # Clean question text
+        q_text = xml_text(_XML_QUESTION_TEXT.get(question["key"], question["text"]))
+        
+        if question["grouped"]:
+            # Complex question with sub-questions; Likert questions carry their scale
+            if scale:
+                parts.append(f'    <question id="{q_id}" type="likert" scale="{scale}">{q_text}</question>\n')
+            else:
+                parts.append(f'    <question id="{q_id}" type="open-ended">{q_text}</question>\n')
+        elif "MCQ" in type_str:
+            # MCQ question with options
+            parts.append(f'    <question id="{q_id}" type="mcq">{q_text}\n')
+            for num, val in question["options"] or ():
+                parts.append(f'      <option value="{num}">{xml_text(val.strip())}</option>\n')
+            parts.append('    </question>\n')
+        elif "Likert" in type_str:
+            # Likert question with scale
+            if scale:
+                parts.append(f'    <question id="{q_id}" type="likert" scale="{scale}">{q_text}</question>\n')
+            else:
+                parts.append(f'    <question id="{q_id}" type="likert">{q_text}</question>\n')
+        else:
+            # Open-ended question
+            parts.append(f'    <question id="{q_id}" type="open-ended">{q_text}</question>\n')
+    
+    parts.append('  </questions>\n')
+    return ''.join(parts)
+
+@lru_cache(maxsize=4)
+def render_markdown_questions(metadata_json):
+    """Render the Markdown Questions section; cached as it depends only on the question metadata"""
+    questions = json.loads(metadata_json)
+    
+    # Add questions
+    parts = ["## Questions\n\n"]
+    
+    for question_key, question_data in questions.items():
+        if isinstance(question_data, dict):
+            parts.append(f"- **{question_key}:** {question_data['base_question']}\n")
+            for sub_key, sub_question in question_data["sub_questions"].items():
+                parts.append(f"  - {sub_key}: {sub_question}\n")
+        else:
+            parts.append(f"- **{question_key}:** {question_data}\n")
+    parts.append("\n")
+    return ''.join(parts)
+
+@lru_cache(maxsize=4)
+def render_txt_questions(metadata_json):
+    """Render the TXT Questions section and the question map for the responses; cached as both depend only on the question metadata"""
+    parts = ["Questions:\n"]
+    question_map = {}  # Map for later use in responses
+    
+    for question_num, question in enumerate(build_question_plan(metadata_json), start=1):
+        key, type_str = question["key"], question["type"]
         
-        # Add responses section
-        html_content += "<h1>Responses</h1>\n"
+        # Simplify the question description
+        qdesc = _TXT_QUESTION_TEXT.get(key, question["text"])
         
-        for response in data['responses']:
-            html_content += f"<h2>Respondent {response['respondent']}</h2>\n"
-            html_content += "<ul>\n"
+        if question["grouped"]:
+            # Grouped question (with sub-questions)
+            type_label = format_likert_label(type_str) if "Likert" in type_str else type_str
             
-            # Get all question keys to ensure we show missing answers
-            all_question_keys = data['questions'].keys()
+            parts.append(f"{question_num}. {key}: {qdesc}")
+            if type_label:
+                parts.append(f" ({type_label})")
+            parts.append("\n")
             
-            for question_key in all_question_keys:
-                if question_key in response['answers']:
-                    answer_value = response['answers'][question_key]
-                    
-                    if isinstance(answer_value, dict):
-                        # Grouped answer (like Parental Education)
-                        html_content += f"  <li><strong>{question_key}:</strong>\n"
-                        html_content += "    <ul>\n"
-                        for sub_key, sub_value in answer_value.items():
-                            html_content += f"      <li>{sub_key}: {sub_value}</li>\n"
-                        html_content += "    </ul>\n"
-                        html_content += "  </li>\n"
-                    else:
-                        # Simple answer
-                        html_content += f"  <li><strong>{question_key}:</strong> {answer_value}</li>\n"
-                else:
-                    # Missing answer
-                    html_content += f"  <li><strong>{question_key}:</strong> (missing)</li>\n"
+            # Add sub-questions (simplified)
+            for sub_key in question["sub_questions"]:
+                parts.append(f"   - {sub_key}\n")
             
-            html_content += "</ul>\n\n"
+            question_map[key] = {"type": type_label, "sub_questions": question["sub_questions"]}
+            continue
+        
+        # Parse and format different question types
+        if "MCQ" in type_str:
+            # MCQ options, e.g. 'MCQ: 1. Male 2. Female'
+            if question["options"] is not None:
+                opt_str = ', '.join([f"{num}. {val.strip()}" for num, val in question["options"]])
+                type_label = f"MCQ: {opt_str}"
+            else:
+                type_label = type_str
+        elif "Likert" in type_str:
+            type_label = format_likert_label(type_str)
+        else:
+            # Open-ended or other
+            type_label = "Open-ended" if not type_str else type_str
+        parts.append(f"{question_num}. {key}: {qdesc} ({type_label})\n")
+        question_map[key] = {"type": type_label}
+    
+    return ''.join(parts), question_map
+
+def convert_json_to_html(source, output_dir):
+    """Convert JSON data to HTML format matching the specified structure"""
+    html_path = os.path.join(output_dir, 'mental_health_questionnaire.html')
+    try:
+        data = load_json_data(source)
         
-        # Save HTML file
-        html_path = os.path.join(output_dir, 'mental_health_questionnaire.html')
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        with open(html_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(render_html_questions(json.dumps(data['questions'])))
+            
+            # Add responses section
+            f.write("<h1>Responses</h1>\n")
+            group_codes = get_group_codes(data)
+            
+            # Every question is listed for each respondent (to show missing answers), so resolve
+            # its answer key and label once for all respondents
+            html_fields = [
+                (
+                    group_codes.get(question_key, question_key),
+                    f"  <li><strong>{xml_text(question_key)}:</strong>",
+                    isinstance(question_data, dict)
+                )
+                for question_key, question_data in data['questions'].items()
+            ]
+            
+            write_in_batches(f, (render_html_respondent(response, html_fields) for response in data['responses']))
         
         print(f"✓ HTML saved to: {html_path}")
         return html_path
         
     except Exception as e:
         print(f"Error creating HTML: {e}")
+        remove_partial_output(html_path)
         return None
 
-def convert_json_to_xml(json_path, output_dir):
+def convert_json_to_xml(source, output_dir):
     """Convert JSON data to structured XML format with detailed question elements."""
+    xml_path = os.path.join(output_dir, 'mental_health_questionnaire.xml')
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        xml_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
-        xml_content += '<questionnaire>\n'
-        
-        # Add Questions section
-        xml_content += '  <questions>\n'
-        
-        # Helper function to convert to camelCase
-        def to_camel_case(text):
-            words = text.replace("-", " ").replace("_", " ").split()
-            return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
-        
-        # Helper function to extract MCQ options
-        def extract_mcq_options(text):
-            opt_match = re.search(r'MCQ: (.+)', text)
-            if not opt_match:
-                return []
-            opts = opt_match.group(1)
-            return re.findall(r'(\d+)\. ([^0-9]+?)(?=(?: \d+\. |$))', opts)
-        
-        # Helper function to extract Likert scale
-        def extract_likert_scale(text):
-            scale_match = re.search(r'Likert (\d+)–(\d+)', text)
-            if scale_match:
-                start, end = scale_match.groups()
-                return f"{start}-{end}"
-            return None
-
-        for question_key, question_data in data['questions'].items():
-            # Generate question ID
-            q_id = to_camel_case(question_key)
+        data = load_json_data(source)
+        
+        with open(xml_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            f.write('<questionnaire>\n')
             
-            if isinstance(question_data, dict):
-                # Complex question with sub-questions
-                base = question_data['base_question']
-                type_str = ""
-                m = re.search(r'\[(.*?)\]', base)
-                if m:
-                    type_str = m.group(1)
-                
-                # Clean question text
-                if question_key == "Parental Education":
-                    q_text = "Years of education of your parents"
-                elif question_key == "Emotional Regulation Frequency":
-                    q_text = "Emotional regulation last month"
-                elif question_key == "Anxiety Symptoms Frequency":
-                    q_text = "Anxiety symptoms past 2 weeks"
-                elif question_key == "Depressive Symptoms Frequency":
-                    q_text = "Depressive symptoms past 2 weeks"
-                else:
-                    q_text = re.sub(r'\[.*?\]', '', base).strip()
-                
-                # Get scale for Likert questions
-                scale = extract_likert_scale(type_str)
-                if scale:
-                    xml_content += f'    <question id="{q_id}" type="likert" scale="{scale}">{q_text}</question>\n'
-                else:
-                    xml_content += f'    <question id="{q_id}" type="open-ended">{q_text}</question>\n'
-            else:
-                # Simple question
-                qtext = question_data
-                m = re.search(r'\[(.*?)\]', qtext)
-                type_str = m.group(1) if m else ""
-                
-                # Clean question text
-                if question_key == "Year of birth":
-                    q_text = "What is your date of birth?"
-                elif question_key == "Gender":
-                    q_text = "What is your gender?"
-                elif question_key == "Socio-economic status":
-                    q_text = "Socio-economic status of your home"
-                elif question_key == "Ethnic identity":
-                    q_text = "Ethnic identity"
-                elif question_key == "Life satisfaction":
-                    q_text = "Life satisfaction"
-                elif question_key == "Happiness":
-                    q_text = "Happiness yesterday"
-                elif question_key == "Laughter":
-                    q_text = "Laughter yesterday"
-                elif question_key == "Learning":
-                    q_text = "Learning yesterday"
-                elif question_key == "Enjoyment":
-                    q_text = "Enjoyment yesterday"
-                elif question_key == "Worry":
-                    q_text = "Worry yesterday"
-                elif question_key == "Depression":
-                    q_text = "Depression yesterday"
-                elif question_key == "Anger":
-                    q_text = "Anger yesterday"
-                elif question_key == "Stress":
-                    q_text = "Stress yesterday"
-                elif question_key == "Loneliness":
-                    q_text = "Loneliness yesterday"
-                else:
-                    q_text = re.sub(r'\[.*?\]', '', qtext).strip()
-                
-                if "MCQ" in type_str:
-                    # MCQ question with options
-                    xml_content += f'    <question id="{q_id}" type="mcq">{q_text}\n'
-                    options = extract_mcq_options(type_str)
-                    for num, val in options:
-                        xml_content += f'      <option value="{num}">{val.strip()}</option>\n'
-                    xml_content += '    </question>\n'
-                elif "Likert" in type_str:
-                    # Likert question with scale
-                    scale = extract_likert_scale(type_str)
-                    if scale:
-                        xml_content += f'    <question id="{q_id}" type="likert" scale="{scale}">{q_text}</question>\n'
-                    else:
-                        xml_content += f'    <question id="{q_id}" type="likert">{q_text}</question>\n'
-                else:
-                    # Open-ended question
-                    xml_content += f'    <question id="{q_id}" type="open-ended">{q_text}</question>\n'
-        
-        xml_content += '  </questions>\n'
-        
-        # Add Responses section
-        xml_content += '  <responses>\n'
-        
-        for response in data['responses']:
-            xml_content += f'    <respondent id="{response["respondent"]}">\n'
+            f.write(render_xml_questions(json.dumps(data['questions'])))
             
-            for answer_key, answer_value in response['answers'].items():
-                # Convert key to camelCase for XML
-                xml_key = to_camel_case(answer_key)
-                
-                if isinstance(answer_value, dict):
-                    # Grouped answers (like Parental Education)
-                    xml_content += f'      <{xml_key}>\n'
-                    if answer_key == "Parental Education":
-                        for sub_key, sub_value in answer_value.items():
-                            sub_xml_key = sub_key.lower()
-                            xml_content += f'        <{sub_xml_key}>{sub_value}</{sub_xml_key}>\n'
-                    elif answer_key == "Emotional Regulation Frequency":
-                        mapping = {
-                            "Upset by Unexpected Events": "unexpectedEvents",
-                            "Unable to Control Important Things": "controlImportantThings",
-                            "Lacked Confidence Handling Problems": "confidence",
-                            "Unable to Cope": "unableToCope",
-                            "Irritated by Life": "irritated",
-                            "On Top of Things": "onTop"
-                        }
-                        for sub_key, sub_value in answer_value.items():
-                            if sub_key in mapping:
-                                xml_content += f'        <{mapping[sub_key]}>{sub_value}</{mapping[sub_key]}>\n'
-                    elif answer_key == "Anxiety Symptoms Frequency":
-                        mapping = {
-                            "Feeling Nervous or On Edge": "nervous",
-                            "Trouble Relaxing": "relaxing",
-                            "Restlessness": "restlessness",
-                            "Irritability": "irritability",
-                            "Fear Something Awful Might Happen": "fear"
-                        }
-                        for sub_key, sub_value in answer_value.items():
-                            if sub_key in mapping:
-                                xml_content += f'        <{mapping[sub_key]}>{sub_value}</{mapping[sub_key]}>\n'
-                    elif answer_key == "Depressive Symptoms Frequency":
-                        mapping = {
-                            "Anhedonia": "anhedonia",
-                            "Sleep Problems": "sleepProblems",
-                            "Fatigue": "fatigue",
-                            "Appetite Changes": "appetite",
-                            "Feelings of Worthlessness": "worthlessness",
-                            "Concentration Difficulties": "concentration",
-                            "Suicidal Thoughts": "suicidalThoughts"
-                        }
-                        for sub_key, sub_value in answer_value.items():
-                            if sub_key in mapping:
-                                xml_content += f'        <{mapping[sub_key]}>{sub_value}</{mapping[sub_key]}>\n'
-                    xml_content += f'      </{xml_key}>\n'
-                else:
-                    # Simple answer
-                    xml_content += f'      <{xml_key}>{answer_value}</{xml_key}>\n'
+            # Add Responses section
+            f.write('  <responses>\n')
+            group_names = get_group_names(data)
+            renderers = build_xml_answer_renderers(data)
             
-            xml_content += '    </respondent>\n'
-        
-        xml_content += '  </responses>\n'
-        xml_content += '</questionnaire>\n'
-        
-        # Save XML file
-        xml_path = os.path.join(output_dir, 'mental_health_questionnaire.xml')
-        with open(xml_path, 'w', encoding='utf-8') as f:
-            f.write(xml_content)
+            write_in_batches(f, (render_xml_respondent(response, renderers, group_names) for response in data['responses']))
+            
+            f.write('  </responses>\n')
+            f.write('</questionnaire>\n')
         
         print(f"✓ XML saved to: {xml_path}")
         return xml_path
         
     except Exception as e:
         print(f"Error creating XML: {e}")
+        remove_partial_output(xml_path)
         return None
 
-def convert_json_to_markdown(json_path, output_dir):
+def convert_json_to_markdown(source, output_dir):
     """Convert JSON data to simple Markdown format"""
+    md_path = os.path.join(output_dir, 'mental_health_questionnaire.md')
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Add questions
-        md_content = "## Questions\n\n"
-        
-        for question_key, question_data in data['questions'].items():
-            if isinstance(question_data, dict):
-                md_content += f"- **{question_key}:** {question_data['base_question']}\n"
-                for sub_key, sub_question in question_data["sub_questions"].items():
-                    md_content += f"  - {sub_key}: {sub_question}\n"
-            else:
-                md_content += f"- **{question_key}:** {question_data}\n"
-        md_content += "\n"
-        
-        # Add responses
-        md_content += "## Responses\n\n"
+        data = load_json_data(source)
         
-        for response in data['responses']:
-            md_content += f"### Respondent {response['respondent']}\n\n"
+        with open(md_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(render_markdown_questions(json.dumps(data['questions'])))
             
-            for answer_key, answer_value in response['answers'].items():
-                if isinstance(answer_value, dict):
-                    md_content += f"- **{answer_key}:**\n"
-                    for sub_key, sub_value in answer_value.items():
-                        md_content += f"  - {sub_key}: {sub_value}\n"
-                else:
-                    md_content += f"- **{answer_key}:** {answer_value}\n"
-            md_content += "\n"
-        
-        # Save Markdown file
-        md_path = os.path.join(output_dir, 'mental_health_questionnaire.md')
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
+            # Add responses
+            f.write("## Responses\n\n")
+            # Bullet label and grouped flag per answer key (short group keys decoded), built once
+            # from the schema so the response loop needs no type checks
+            md_fields = {
+                question_key: (f"- **{question_key}:**", isinstance(question_data, dict))
+                for question_key, question_data in data['questions'].items()
+            }
+            md_fields.update((answer_key, (f"- **{group_name}:**", True)) for answer_key, group_name in get_group_names(data).items())
+            
+            write_in_batches(f, (render_markdown_respondent(response, md_fields) for response in data['responses']))
         
         print(f"✓ Markdown saved to: {md_path}")
         return md_path
         
     except Exception as e:
         print(f"Error creating Markdown: {e}")
+        remove_partial_output(md_path)
         return None
 
-def convert_json_to_txt(json_path, output_dir):
+def convert_json_to_txt(source, output_dir):
     """Convert JSON data to structured plain text format with numbered questions and responses, matching the requested style."""
+    txt_path = os.path.join(output_dir, 'mental_health_questionnaire.txt')
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_data(source)
+        
+        with open(txt_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            # Use the canonical order from get_question_metadata
+            question_metadata = get_question_metadata()
+            questions = question_metadata
+
+            questions_text, question_map = render_txt_questions(json.dumps(questions))
+            f.write(questions_text)
+
+            f.write("\nResponses:\n")
+            group_codes = get_group_codes(data)
+            # Resolve each question's answer key and sub-questions once for all respondents
+            answer_fields = [
+                (key, group_codes.get(key, key), question_map[key].get("sub_questions"))
+                for key in questions
+            ]
+            write_in_batches(f, (render_txt_respondent(response, answer_fields) for response in data['responses']))
 
-        # Use the canonical order from get_question_metadata
-        question_metadata = get_question_metadata()
-        questions = question_metadata
-
-        txt_content = "Questions:\n"
-        question_num = 1
-        question_map = {}  # Map for later use in responses
-
-        for key, meta in questions.items():
-            if isinstance(meta, dict):
-                # Grouped question (with sub-questions)
-                base = meta["base_question"]
-                # Extract type/scale from base question
-                type_str = ""
-                m = re.search(r'\[(.*?)\]', base)
-                if m:
-                    type_str = m.group(1)
-                
-                # Clean and simplify the base question text
-                qdesc = re.sub(r'\[.*?\]', '', base).strip()
-                
-                # Simplify long descriptions for grouped questions
-                if key == "Parental Education":
-                    qdesc = "Years of education of your parents"
-                elif key == "Emotional Regulation Frequency":
-                    qdesc = "Emotional Regulation Frequency"
-                elif key == "Anxiety Symptoms Frequency":
-                    qdesc = "Anxiety Symptoms Frequency"
-                elif key == "Depressive Symptoms Frequency":
-                    qdesc = "Depressive Symptoms Frequency"
-                
-                # Format type for grouped questions
-                if "Likert" in type_str:
-                    # Parse Likert range and labels
-                    likert_match = re.search(r'Likert (\d+)–(\d+): (.+)', type_str)
-                    if likert_match:
-                        start, end, labels = likert_match.groups()
-                        type_label = f"Likert {start}–{end}: {labels}"
-                    else:
-                        # Simple Likert without labels
-                        likert_simple = re.search(r'Likert (\d+)–(\d+)', type_str)
-                        if likert_simple:
-                            start, end = likert_simple.groups()
-                            type_label = f"Likert {start}–{end}"
-                        else:
-                            type_label = type_str
-                else:
-                    type_label = type_str
-                
-                txt_content += f"{question_num}. {key}: {qdesc}"
-                if type_label:
-                    txt_content += f" ({type_label})"
-                txt_content += "\n"
-                
-                # Add sub-questions (simplified)
-                for sub_key in meta["sub_questions"].keys():
-                    txt_content += f"   - {sub_key}\n"
-                
-                question_map[key] = {"type": type_label, "sub_questions": list(meta["sub_questions"].keys())}
-            else:
-                # Simple question
-                qtext = meta
-                # Extract type/options from brackets
-                m = re.search(r'\[(.*?)\]', qtext)
-                type_str = m.group(1) if m else ""
-                # Clean the question text
-                qdesc = re.sub(r'\[.*?\]', '', qtext).strip()
-                
-                # Simplify some question descriptions
-                if key == "Year of birth":
-                    qdesc = "What is your date of birth?"
-                elif key == "Gender":
-                    qdesc = "What is your gender?"
-                elif key == "Socio-economic status":
-                    qdesc = "What is the socio-economic status of your home?"
-                elif key == "Ethnic identity":
-                    qdesc = "You are or are recognized as:"
-                elif key == "Life satisfaction":
-                    qdesc = "In general, how satisfied are you with life?"
-                elif key == "Happiness":
-                    qdesc = "How happy did you feel yesterday?"
-                elif key == "Laughter":
-                    qdesc = "How much did you laugh yesterday?"
-                elif key == "Learning":
-                    qdesc = "Did you learn new or exciting things yesterday?"
-                elif key == "Enjoyment":
-                    qdesc = "How much did you enjoy activities yesterday?"
-                elif key == "Worry":
-                    qdesc = "How worried did you feel yesterday?"
-                elif key == "Depression":
-                    qdesc = "How depressed did you feel yesterday?"
-                elif key == "Anger":
-                    qdesc = "How angry did you feel yesterday?"
-                elif key == "Stress":
-                    qdesc = "How much stress did you feel yesterday?"
-                elif key == "Loneliness":
-                    qdesc = "How lonely did you feel yesterday?"
-                
-                # Parse and format different question types
-                if "MCQ" in type_str:
-                    # Parse MCQ options: e.g. 'MCQ: 1. Male 2. Female'
-                    opt_match = re.search(r'MCQ: (.+)', type_str)
-                    if opt_match:
-                        opts = opt_match.group(1)
-                        # Split by number-dot pattern and clean up
-                        opt_list = re.findall(r'(\d+)\. ([^0-9]+?)(?=(?: \d+\. |$))', opts)
-                        opt_str = ', '.join([f"{num}. {val.strip()}" for num, val in opt_list])
-                        type_label = f"MCQ: {opt_str}"
-                    else:
-                        type_label = type_str
-                    txt_content += f"{question_num}. {key}: {qdesc} ({type_label})\n"
-                    question_map[key] = {"type": type_label}
-                elif "Likert" in type_str:
-                    # Parse Likert range and labels
-                    likert_match = re.search(r'Likert (\d+)–(\d+): (.+)', type_str)
-                    if likert_match:
-                        start, end, labels = likert_match.groups()
-                        type_label = f"Likert {start}–{end}: {labels}"
-                    else:
-                        # Simple Likert without labels
-                        likert_simple = re.search(r'Likert (\d+)–(\d+)', type_str)
-                        if likert_simple:
-                            start, end = likert_simple.groups()
-                            type_label = f"Likert {start}–{end}"
-                        else:
-                            type_label = type_str
-                    txt_content += f"{question_num}. {key}: {qdesc} ({type_label})\n"
-                    question_map[key] = {"type": type_label}
-                else:
-                    # Open-ended or other
-                    type_label = "Open-ended" if not type_str else type_str
-                    txt_content += f"{question_num}. {key}: {qdesc} ({type_label})\n"
-                    question_map[key] = {"type": type_label}
-            question_num += 1
-
-        txt_content += "\nResponses:\n"
-        for response in data['responses']:
-            txt_content += f"Respondent {response['respondent']}:\n"
-            for key, meta in questions.items():
-                if key not in response['answers']:
-                    continue
-                answer = response['answers'][key]
-                if isinstance(meta, dict):
-                    txt_content += f"- {key}:\n"
-                    for subq in meta["sub_questions"].keys():
-                        val = answer.get(subq, "") if isinstance(answer, dict) else ""
-                        txt_content += f"  - {subq}: {val}\n"
-                else:
-                    txt_content += f"- {key}: {answer}\n"
-            txt_content += "\n"
-
-        txt_path = os.path.join(output_dir, 'mental_health_questionnaire.txt')
-        with open(txt_path, 'w', encoding='utf-8') as f:
-            f.write(txt_content)
         print(f"✓ TXT saved to: {txt_path}")
         return txt_path
     except Exception as e:
         print(f"Error creating TXT: {e}")
+        remove_partial_output(txt_path)
         return None
 
-def convert_to_specific_formats(json_path, output_dir, formats_to_generate):
-    """Convert JSON to specified formats"""
+# Output format -> (display name, converter), in the order the formats are generated
+_FORMAT_CONVERTERS = {
+    'html': ("HTML", convert_json_to_html),
+    'xml': ("XML", convert_json_to_xml),
+    'markdown': ("Markdown", convert_json_to_markdown),
+    'txt': ("TXT", convert_json_to_txt)
+}
+
+def convert_to_specific_formats(source, output_dir, formats_to_generate):
+    """Convert JSON (a file path or already-loaded data) to specified formats"""
     print(f"\n=== Converting to requested formats: {', '.join(formats_to_generate)} ===")
     
-    formats_created = []
-    
-    if 'html' in formats_to_generate:
-        # Convert to HTML
-        html_path = convert_json_to_html(json_path, output_dir)
-        if html_path:
-            formats_created.append("HTML")
-    
-    if 'xml' in formats_to_generate:
-        # Convert to XML
-        xml_path = convert_json_to_xml(json_path, output_dir)
-        if xml_path:
-            formats_created.append("XML")
+    # Parse the JSON once (if not already in memory) and share it between the converters
+    try:
+        data = load_json_data(source)
+    except Exception as e:
+        print(f"Error reading JSON: {e}")
+        return []
     
-    if 'markdown' in formats_to_generate:
-        # Convert to Markdown
-        md_path = convert_json_to_markdown(json_path, output_dir)
-        if md_path:
-            formats_created.append("Markdown")
+    # Each converter writes its own file from the same data, so they can run concurrently
+    with ThreadPoolExecutor(max_workers=len(_FORMAT_CONVERTERS)) as executor:
+        futures = [
+            (format_name, executor.submit(converter, data, output_dir))
+            for format_key, (format_name, converter) in _FORMAT_CONVERTERS.items()
+            if format_key in formats_to_generate
+        ]
     
-    if 'txt' in formats_to_generate:
-        # Convert to TXT
-        txt_path = convert_json_to_txt(json_path, output_dir)
-        if txt_path:
-            formats_created.append("TXT")
+    formats_created = [format_name for format_name, future in futures if future.result()]
     
     print(f"\n✓ Successfully created {len(formats_created)} format(s): {', '.join(formats_created)}")
     return formats_created
 
-def convert_to_all_formats(json_path, output_dir):
+def convert_to_all_formats(source, output_dir):
     """Convert JSON to all supported formats"""
-    return convert_to_specific_formats(json_path, output_dir, ['html', 'xml', 'markdown', 'txt'])
+    return convert_to_specific_formats(source, output_dir, list(_FORMAT_CONVERTERS))
 
 def parse_arguments():
     """Parse command line arguments"""
@@ -951,9 +1079,9 @@ if __name__ == "__main__":
         formats_to_generate = ['html', 'xml', 'markdown', 'txt']
     
     # Convert Excel to JSON (always done as base format)
-    json_path = convert_excel_to_json()
+    result = convert_excel_to_json()
     
-    # If JSON conversion was successful, convert to requested formats
-    if json_path:
-        output_dir = os.path.join('preprocessed_data', 'self-repoted-mental-health-college-students-2022')
-        convert_to_specific_formats(json_path, output_dir, formats_to_generate)
+    # If JSON conversion was successful, convert the in-memory data to requested formats
+    if result:
+        json_path, data = result
+        convert_to_specific_formats(data, _OUTPUT_DIR, formats_to_generate)
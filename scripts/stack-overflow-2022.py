@@ -1,48 +1,206 @@
 import pandas as pd
+import numpy as np
 import json
 import os
 import re
 import argparse
 import unicodedata
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from pyarrow import csv as pacsv
+except ImportError:
+    pacsv = None
+
+# Rows parsed per CSV chunk while selecting the responses with the fewest missing answers
+CSV_CHUNK_SIZE = 50_000
+
+# Values pandas reads as NaN by default, so the PyArrow reader finds the same missing answers
+_CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+# Patterns compiled once at import instead of on every call
+_WS_RE = re.compile(r'\s+')
+_MCQ_BODY_RE = re.compile(r'MCQ(?:-Multi)?: (.+?)\]')
+# An option is a letter marker ("A. ") at the start or after whitespace, up to the next marker
+_MCQ_OPTION_RE = re.compile(r'(?:^|\s)([A-Z])\.\s+(.+?)(?=\s+[A-Z]\.\s|$)')
+_QUESTION_TYPE_RE = re.compile(r'\[(.*?)\]')
+
+# Create MCQ mappings for converting full text answers to letter codes
+MCQ_MAPPINGS = {
+    "MainBranch": {
+        "I am a developer by profession": "A",
+        "I am not primarily a developer, but I write code sometimes as part of my work": "B", 
+        "I used to be a developer by profession, but no longer am": "C",
+        "I am learning to code": "D",
+        "I code primarily as a hobby": "E",
+        "None of these": "F"
+    },
+    "Employment": {
+        "Employed, full-time": "A",
+        "Employed, part-time": "B", 
+        "Independent contractor, freelancer, or self-employed": "C",
+        "Not employed, but looking for work": "D",
+        "Not employed, and not looking for work": "E",
+        "Student, full-time": "F",
+        "Student, part-time": "G",
+        "Retired": "H",
+        "Prefer not to say": "I"
+    },
+    "EdLevel": {
+        "Primary/elementary school": "A",
+        "Secondary school (e.g. American high school, German Realschule or Gymnasium, etc.)": "B",
+        "Some college/university study without earning a degree": "C", 
+        "Associate degree (A.A., A.S., etc.)": "D",
+        "Bachelor's degree (B.A., B.S., B.Eng., etc.)": "E",
+        "Master's degree (M.A., M.S., M.Eng., MBA, etc.)": "F",
+        "Professional degree (JD, MD, etc.)": "G",
+        "Other doctoral degree (Ph.D., Ed.D., etc.)": "H",
+        "Something else": "I"
+    },
+    "CompFreq": {
+        "Weekly": "A",
+        "Monthly": "B",
+        "Yearly": "C"
+    },
+    "VersionControlSystem": {
+        "Git": "A",
+        "Mercurial": "B", 
+        "SVN": "C",
+        "I don't use one": "D"
+    }
+}
+
+# Curly apostrophes, primes, curly quotes and dashes mapped to their ASCII forms in one pass
+_NORMALIZE_TRANS = str.maketrans({
+    '\u2018': "'", '\u2019': "'", '\u2032': "'",
+    '\u201c': '"', '\u201d': '"',
+    '\u2013': '-', '\u2014': '-'
+})
+
+def _normalize_text(text):
+    """Normalize text to handle character encoding differences"""
+    # Replace various apostrophe, quote and dash characters with their standard forms
+    text = text.translate(_NORMALIZE_TRANS)
+    # Handle any remaining Unicode quotation marks (NFKC already includes the NFKD decomposition)
+    return unicodedata.normalize('NFKC', text)
+
+# MCQ mappings keyed by normalized answer text, so each answer is normalized once and looked up directly
+NORM_MAPPINGS = {
+    question_code: {_normalize_text(answer): code for answer, code in mapping.items()}
+    for question_code, mapping in MCQ_MAPPINGS.items()
+}
+
+@lru_cache(maxsize=4096)
+def lookup_mcq_answer(question_code, answer):
+    """Look up the letter code for a single MCQ answer, keeping the original if not found"""
+    return NORM_MAPPINGS[question_code].get(_normalize_text(answer), answer)
+
+def clean_answer(value):
+    """Clean a text answer, with empty text as None; numbers are kept as they are"""
+    if isinstance(value, (int, float)):
+        return value
+    return clean_text(str(value)) or None
+
+def convert_column_answers(question_code, values):
+    """Map each distinct answer of a column to its cleaned form, with MCQ answers converted to letter codes"""
+    answers = pd.Series([clean_answer(value) for value in values], index=values, dtype=object)
+    converted = answers.to_dict()
+    if question_code not in NORM_MAPPINGS:
+        return converted
+    
+    # Multi-select answers are semicolon separated; find them all with one vectorized check
+    texts = answers[[isinstance(answer, str) for answer in answers]]
+    multi_select = texts.str.contains(';', regex=False)
+    for value, answer in texts[~multi_select].items():
+        converted[value] = lookup_mcq_answer(question_code, answer)
+    for value, options in texts[multi_select].str.split(';').items():
+        converted[value] = [lookup_mcq_answer(question_code, option.strip()) for option in options]
+    return converted
 
 def clean_text(text):
     """Clean text by removing extra whitespace and normalizing"""
     if text is None:
         return None
     if isinstance(text, str):
+        # Fast path: the only whitespace in printable text is plain spaces, so text
+        # without doubled or surrounding spaces is already clean
+        if not text or (text.isprintable() and '  ' not in text and text[0] != ' ' and text[-1] != ' '):
+            return text
         # Remove extra whitespace and normalize
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         return text.strip()
     return text
 
-def examine_csv_structure(csv_path):
-    """Examine the CSV file structure to understand the data"""
-    try:
-        print("=== Examining CSV Structure ===")
-        
-        # Read first few rows to understand structure
-        df_sample = pd.read_csv(csv_path, nrows=5)
-        print(f"CSV Shape: {df_sample.shape}")
-        print(f"Total Columns: {len(df_sample.columns)}")
-        
-        print("\nColumn Names (first 10):")
-        for i, col in enumerate(df_sample.columns[:10]):
-            print(f"  {i+1}. {col}")
-        
-        if len(df_sample.columns) > 10:
-            print(f"  ... and {len(df_sample.columns)-10} more columns")
-        
-        print("\nSample Data (first 3 rows, first 5 columns):")
-        print(df_sample.iloc[:3, :5])
-        
-        return df_sample.columns.tolist()
-        
-    except FileNotFoundError:
-        print(f"Error: CSV file not found at {csv_path}")
-        return None
-    except Exception as e:
-        print(f"Error examining CSV: {e}")
-        return None
+def read_csv_chunks(csv_path, columns):
+    """Yield the selected CSV columns as DataFrames of CSV_CHUNK_SIZE rows"""
+    if pacsv is None:
+        yield from pd.read_csv(csv_path, usecols=columns, chunksize=CSV_CHUNK_SIZE)
+        return
+    
+    # PyArrow parses the file with multiple threads and keeps strings in compact Arrow buffers;
+    # rows are only turned into pandas objects one chunk at a time
+    table = pacsv.read_csv(csv_path, convert_options=pacsv.ConvertOptions(
+        include_columns=columns, null_values=_CSV_NA_VALUES, strings_can_be_null=True
+    ))
+    for offset in range(0, table.num_rows, CSV_CHUNK_SIZE):
+        chunk = table.slice(offset, CSV_CHUNK_SIZE).to_pandas()
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        yield chunk
+
+def write_json(json_path, data):
+    """Write the survey data as JSON indented by two spaces, using orjson when it is installed"""
+    if orjson is not None:
+        # orjson serializes the whole document in native code, straight to UTF-8 bytes
+        with open(json_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    
+    # Write one response at a time, keeping the indented layout of a single json.dump
+    # (JSON strings escape newlines, so re-indenting on '\n' only touches the layout)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        questions_json = json.dumps(data["questions"], indent=2, ensure_ascii=False).replace('\n', '\n  ')
+        f.write(f'{{\n  "questions": {questions_json},\n  "responses": [')
+        for idx, response in enumerate(data["responses"]):
+            response_json = json.dumps(response, indent=2, ensure_ascii=False).replace('\n', '\n    ')
+            f.write(f'{"," if idx else ""}\n    {response_json}')
+        f.write('\n  ]\n}' if data["responses"] else ']\n}')
+
+def load_json_data(source):
+    """Return the survey data from a JSON file path, or the dict itself if already loaded"""
+    if isinstance(source, dict):
+        return source
+    if orjson is not None:
+        # orjson parses straight from bytes and is considerably faster than the json module
+        with open(source, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(source, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def select_fewest_missing(nan_counts, limit):
+    """Positions of the rows with the fewest NaN values, least first and in file order on ties"""
+    if len(nan_counts) > limit:
+        # Partition instead of sorting everything: keep all rows below the cut-off count
+        # and the earliest rows that tie with it
+        cutoff = np.partition(nan_counts, limit - 1)[limit - 1]
+        below = np.flatnonzero(nan_counts < cutoff)
+        ties = np.flatnonzero(nan_counts == cutoff)[:limit - len(below)]
+        positions = np.sort(np.concatenate([below, ties]))
+    else:
+        positions = np.arange(len(nan_counts))
+    return positions[np.argsort(nan_counts[positions], kind='stable')]
+
+def xml_text(value):
+    """Escape &, < and > in text values for XML/HTML element content; numbers pass through"""
+    return escape(value) if isinstance(value, str) else value
 
 def convert_csv_to_json():
     """Convert Stack Overflow CSV data to JSON format - 500 responses with minimal NaN values"""
@@ -68,118 +226,19 @@ def convert_csv_to_json():
         "VersionControlSystem": "Version control systems used [MCQ: A. Git B. Mercurial C. SVN D. I don't use one]"
     }
     
-    # Create MCQ mappings for converting full text answers to letter codes
-    mcq_mappings = {
-        "MainBranch": {
-            "I am a developer by profession": "A",
-            "I am not primarily a developer, but I write code sometimes as part of my work": "B", 
-            "I used to be a developer by profession, but no longer am": "C",
-            "I am learning to code": "D",
-            "I code primarily as a hobby": "E",
-            "None of these": "F"
-        },
-        "Employment": {
-            "Employed, full-time": "A",
-            "Employed, part-time": "B", 
-            "Independent contractor, freelancer, or self-employed": "C",
-            "Not employed, but looking for work": "D",
-            "Not employed, and not looking for work": "E",
-            "Student, full-time": "F",
-            "Student, part-time": "G",
-            "Retired": "H",
-            "Prefer not to say": "I"
-        },
-        "EdLevel": {
-            "Primary/elementary school": "A",
-            "Secondary school (e.g. American high school, German Realschule or Gymnasium, etc.)": "B",
-            "Some college/university study without earning a degree": "C", 
-            "Associate degree (A.A., A.S., etc.)": "D",
-            "Bachelor's degree (B.A., B.S., B.Eng., etc.)": "E",
-            "Bachelor's degree (B.A., B.S., B.Eng., etc.)": "E",  # Handle Unicode apostrophe
-            "Bachelor's degree (B.A., B.S., B.Eng., etc.)": "E",  # Handle another Unicode apostrophe variation
-            "Master's degree (M.A., M.S., M.Eng., MBA, etc.)": "F",
-            "Master's degree (M.A., M.S., M.Eng., MBA, etc.)": "F",  # Handle Unicode apostrophe
-            "Master's degree (M.A., M.S., M.Eng., MBA, etc.)": "F",  # Handle another Unicode apostrophe variation
-            "Professional degree (JD, MD, etc.)": "G",
-            "Other doctoral degree (Ph.D., Ed.D., etc.)": "H",
-            "Something else": "I"
-        },
-        "CompFreq": {
-            "Weekly": "A",
-            "Monthly": "B",
-            "Yearly": "C"
-        },
-        "VersionControlSystem": {
-            "Git": "A",
-            "Mercurial": "B", 
-            "SVN": "C",
-            "I don't use one": "D"
-        }
-    }
-    
-    def convert_mcq_answer(question_code, answer_value):
-        """Convert MCQ answer from full text to letter code"""
-        if question_code not in mcq_mappings or answer_value is None:
-            return answer_value
-            
-        mapping = mcq_mappings[question_code]
-        
-        # Normalize text to handle character encoding differences
-        def normalize_text(text):
-            # Replace various apostrophe and quote characters with standard apostrophe
-            text = text.replace("'", "'").replace("'", "'").replace("′", "'")
-            text = text.replace(""", '"').replace(""", '"')  # Handle quote marks
-            text = text.replace("–", "-").replace("—", "-")  # Handle dashes
-            # Handle any remaining Unicode quotation marks
-            # Normalize to decomposed form and then back to composed
-            text = unicodedata.normalize('NFKD', text)
-            text = unicodedata.normalize('NFKC', text)
-            return text
-        
-        # Handle multi-select questions (like Employment) - semicolon separated
-        if ';' in str(answer_value):
-            answers = [ans.strip() for ans in str(answer_value).split(';')]
-            letter_codes = []
-            for ans in answers:
-                normalized_ans = normalize_text(ans)
-                # Try both original and normalized versions
-                if ans in mapping:
-                    letter_codes.append(mapping[ans])
-                elif normalized_ans in mapping:
-                    letter_codes.append(mapping[normalized_ans])
-                else:
-                    letter_codes.append(ans)  # Keep original if not found
-            return letter_codes
-        else:
-            # Single answer
-            normalized_value = normalize_text(answer_value)
-            # Try both original and normalized versions
-            if answer_value in mapping:
-                return mapping[answer_value]
-            elif normalized_value in mapping:
-                return mapping[normalized_value]
-            else:
-                return answer_value
-    
     try:
         print("Reading Stack Overflow CSV file...")
         
-        # First examine the structure
-        columns = examine_csv_structure(csv_path)
-        if columns is None:
-            return None
-        
-        # Read the full CSV file
-        print("\nReading full CSV file...")
-        df = pd.read_csv(csv_path)
-        print(f"Successfully loaded: {len(df)} rows, {len(df.columns)} columns")
+        # Read only the header to find out which columns exist
+        header = pd.read_csv(csv_path, nrows=0).columns
+        print(f"CSV has {len(header)} columns")
         
         # Check which selected questions exist in the data
         available_questions = {}
         missing_questions = []
         
         for question_code, description in selected_questions.items():
-            if question_code in df.columns:
+            if question_code in header:
                 available_questions[question_code] = description
             else:
                 missing_questions.append(question_code)
@@ -188,23 +247,43 @@ def convert_csv_to_json():
         if missing_questions:
             print(f"Missing questions: {missing_questions}")
         
-        # Filter to only selected columns that exist
-        df_selected = df[list(available_questions.keys())]
-        
-        # Filter responses with minimal NaN values (only for selected columns)
+        # Stream the selected columns in chunks, keeping only the 500 rows with the fewest NaN values
+        # seen so far, so memory stays bounded by the chunk size rather than the file size
+        print("\nReading selected columns from CSV file...")
         print("Filtering responses with minimal NaN values...")
+        question_columns = list(available_questions.keys())
+        total_rows = 0
+        df_best = None
+        best_nan_counts = None
+        
+        for chunk in read_csv_chunks(csv_path, question_columns):
+            total_rows += len(chunk)
+            
+            # Count NaN values per row (only for selected columns), in the selected question order
+            chunk = chunk[question_columns]
+            nan_counts = chunk.isna().to_numpy().sum(axis=1)
+            
+            # Earlier rows come first, so ties keep file order
+            if df_best is not None:
+                chunk = pd.concat([df_best, chunk])
+                nan_counts = np.concatenate([best_nan_counts, nan_counts])
+            
+            positions = select_fewest_missing(nan_counts, 500)
+            df_best = chunk.iloc[positions]
+            best_nan_counts = nan_counts[positions]
         
-        # Calculate NaN percentage for each row (only for selected columns)
-        df_selected['nan_percentage'] = df_selected.isnull().sum(axis=1) / len(available_questions) * 100
+        if df_best is None:
+            print("Error: CSV file contains no responses")
+            return None
         
-        # Sort by NaN percentage (ascending - least NaN first)
-        df_sorted = df_selected.sort_values('nan_percentage')  # type: ignore
+        print(f"Successfully loaded: {total_rows} rows, {len(question_columns)} columns")
         
-        # Take first 500 responses with minimal NaN values
-        df_filtered = df_sorted.head(500).drop('nan_percentage', axis=1)
+        # The 500 responses with minimal NaN values, least NaN first
+        df_filtered = df_best
+        nan_percentage = best_nan_counts / len(available_questions) * 100
         
         print(f"Selected 500 responses with minimal NaN values")
-        print(f"Average NaN percentage in selected data: {df_sorted.head(500)['nan_percentage'].mean():.1f}%")
+        print(f"Average NaN percentage in selected data: {nan_percentage.mean():.1f}%")
         
         # Create JSON structure according to the specified format
         data = {
@@ -221,32 +300,20 @@ def convert_csv_to_json():
         
         # Process responses
         print("Processing 500 selected responses...")
-        for idx, (_, row) in enumerate(df_filtered.iterrows()):
-            response = {
-                "answers": {}
-            }
-            
-            # Process each column/question
-            for column in df_filtered.columns:
-                value = row[column]
-                
-                # Clean and process the value
-                if value is None or (isinstance(value, (int, float)) and pd.isna(value)):
-                    response["answers"][column] = None
-                else:
-                    # Convert to appropriate type
-                    if isinstance(value, (int, float)):
-                        response["answers"][column] = value
-                    else:
-                        cleaned_value = clean_text(str(value))
-                        if cleaned_value:
-                            # Apply MCQ conversion if applicable
-                            converted_value = convert_mcq_answer(column, cleaned_value)
-                            response["answers"][column] = converted_value
-                        else:
-                            response["answers"][column] = None
-            
-            data["responses"].append(response)
+        
+        # Convert each distinct text answer once per column and map the results onto every row;
+        # numeric columns are kept as they are
+        df_answers = df_filtered.astype(object)
+        for column in df_filtered.columns:
+            if df_filtered[column].dtype == object:
+                converted = convert_column_answers(column, df_filtered[column].dropna().unique())
+                df_answers[column] = df_filtered[column].map(converted)
+        
+        # Build one answers dict per row in a single pass, with missing values as None
+        records = df_answers.where(df_filtered.notna(), None).to_dict(orient='records')
+        
+        for idx, answers in enumerate(records):
+            data["responses"].append({"answers": answers})
             
             # Progress indicator
             if (idx + 1) % 100 == 0:
@@ -260,8 +327,7 @@ def convert_csv_to_json():
         json_path = os.path.join(output_dir, 'survey_results_sample.json')
         print(f"\nSaving JSON to: {json_path}")
         
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        write_json(json_path, data)
         
         print(f"✓ JSON saved to: {json_path}")
         print(f"✓ Total responses: {len(data['responses'])}")
@@ -271,7 +337,7 @@ def convert_csv_to_json():
         file_size = os.path.getsize(json_path) / (1024 * 1024)  # MB
         print(f"✓ File size: {file_size:.1f} MB")
         
-        return json_path
+        return json_path, data
         
     except FileNotFoundError:
         print(f"Error: File not found at {csv_path}")
@@ -283,317 +349,261 @@ def convert_csv_to_json():
         traceback.print_exc()
         return None
 
-def convert_json_to_html(json_path, output_dir):
-    """Convert JSON data to HTML format matching the specified structure"""
-    try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        def format_answer_value(value):
-            """Format answer value for display"""
-            if isinstance(value, list):
-                return ", ".join(str(v) for v in value)
-            return str(value) if value is not None else "(missing)"
-        
-        # Start HTML content
-        html_content = "<h1>Questions</h1>\n<ul>\n"
-        
-        # Add questions section - extract question code and description from the format "QuestionCode: Description"
-        for question in data['questions']:
-            if ':' in question:
-                question_code, description = question.split(':', 1)
-                question_code = question_code.strip()
-                description = description.strip()
-                html_content += f"  <li><strong>{question_code}:</strong> {description}</li>\n"
-            else:
-                # Fallback if format is different
-                html_content += f"  <li><strong>{question}:</strong></li>\n"
-        
-        html_content += "</ul>\n\n"
-        
-        # Add responses section
-        html_content += "<h1>Responses</h1>\n"
-        
-        for i, response in enumerate(data['responses']):
-            html_content += f"<h2>Respondent {i + 1}</h2>\n"
-            html_content += "<ul>\n"
+def to_camel_case(text):
+    """Convert a column name to a camelCase XML element name"""
+    words = text.replace("-", " ").replace("_", " ").split()
+    return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
+
+@lru_cache(maxsize=None)
+def extract_mcq_options(text):
+    """Extract (letter, option) pairs from an MCQ question description, parsed once per description"""
+    opt_match = _MCQ_BODY_RE.search(text)
+    if not opt_match:
+        return ()
+    return tuple((letter, value.strip()) for letter, value in _MCQ_OPTION_RE.findall(opt_match.group(1)))
+
+def format_answer_value(value, missing):
+    """Format answer value for display, with `missing` shown for unanswered questions"""
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value)
+    return str(value) if value is not None else missing
+
+def render_html_questions(questions):
+    """Render the HTML questions section and the responses heading"""
+    html_parts = ["<h1>Questions</h1>\n<ul>\n"]
+    
+    # Extract question code and description from the format "QuestionCode: Description"
+    for question in questions:
+        if ':' in question:
+            question_code, description = question.split(':', 1)
+            question_code = question_code.strip()
+            description = description.strip()
+            html_parts.append(f"  <li><strong>{xml_text(question_code)}:</strong> {xml_text(description)}</li>\n")
+        else:
+            # Fallback if format is different
+            html_parts.append(f"  <li><strong>{xml_text(question)}:</strong></li>\n")
+    
+    html_parts.append("</ul>\n\n")
+    html_parts.append("<h1>Responses</h1>\n")
+    return ''.join(html_parts)
+
+def render_html_respondent(i, answers):
+    """Render one respondent as an HTML list"""
+    html_parts = [f"<h2>Respondent {i + 1}</h2>\n", "<ul>\n"]
+    for question_key, answer_value in answers.items():
+        formatted_value = format_answer_value(answer_value, "(missing)")
+        html_parts.append(f"  <li><strong>{xml_text(question_key)}:</strong> {xml_text(formatted_value)}</li>\n")
+    html_parts.append("</ul>\n\n")
+    return ''.join(html_parts)
+
+def render_xml_questions(questions):
+    """Render the XML declaration, the questions section and the opening responses tag"""
+    xml_parts = ['<?xml version="1.0" encoding="UTF-8"?>\n']
+    xml_parts.append('<questionnaire>\n')
+    xml_parts.append('  <questions>\n')
+    
+    for question in questions:
+        # Parse question string
+        parts = question.split(':', 1)
+        if len(parts) != 2:
+            continue
             
-            # Get all question keys (should match the order of questions)
-            if data['responses']:
-                all_question_keys = list(response['answers'].keys())
-                
-                for question_key in all_question_keys:
-                    answer_value = response['answers'].get(question_key)
-                    formatted_value = format_answer_value(answer_value)
-                    html_content += f"  <li><strong>{question_key}:</strong> {formatted_value}</li>\n"
+        question_key = parts[0].strip()
+        if question_key == "ResponseId":
+            continue  # Skip the response ID
             
-            html_content += "</ul>\n\n"
-        
-        # Save HTML file
-        html_path = os.path.join(output_dir, 'survey_results_sample.html')
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        print(f"✓ HTML saved to: {html_path}")
-        return html_path
-        
-    except Exception as e:
-        print(f"Error creating HTML: {e}")
-        return None
+        # Generate question ID
+        q_id = to_camel_case(question_key)
+        
+        # Extract question type and text
+        question_desc = parts[1].strip()
+        type_match = _QUESTION_TYPE_RE.search(question_desc)
+        if type_match:
+            type_str = type_match.group(1)
+            q_text = question_desc.split('[')[0].strip()
+        else:
+            type_str = "Open-ended"
+            q_text = question_desc
+        
+        if "MCQ" in type_str:
+            # MCQ question with options
+            xml_parts.append(f'    <question id="{q_id}" type="mcq">{xml_text(q_text)}\n')
+            options = extract_mcq_options(question_desc)
+            for letter, val in options:
+                xml_parts.append(f'      <option value="{letter}">{xml_text(val.strip())}</option>\n')
+            xml_parts.append('    </question>\n')
+        else:
+            # Open-ended question
+            xml_parts.append(f'    <question id="{q_id}" type="open-ended">{xml_text(q_text)}</question>\n')
+    
+    xml_parts.append('  </questions>\n')
+    xml_parts.append('  <responses>\n')
+    return ''.join(xml_parts)
 
-def convert_json_to_xml(json_path, output_dir):
-    """Convert JSON data to structured XML format with detailed question elements."""
+def build_xml_tags(data):
+    """Build the camelCase element tags of each answer once, since every response has the same columns"""
+    xml_tags = {}
+    if data['responses']:
+        for answer_key in data['responses'][0]['answers']:
+            if answer_key != "ResponseId":  # Skip the response ID
+                xml_key = to_camel_case(answer_key)
+                xml_tags[answer_key] = (f'      <{xml_key}>', f'</{xml_key}>\n')
+    return xml_tags
+
+def render_xml_respondent(i, answers, xml_tags):
+    """Render one respondent as an XML element"""
+    xml_parts = [f'    <respondent id="{i+1}">\n']
+    for answer_key, answer_value in answers.items():
+        tags = xml_tags.get(answer_key)
+        if tags is None:
+            continue  # Skip the response ID
+        
+        if isinstance(answer_value, list):
+            # Handle multi-select answers
+            answer_value = ','.join(str(v) for v in answer_value)
+        xml_parts.append(f'{tags[0]}{xml_text(answer_value)}{tags[1]}')
+    xml_parts.append('    </respondent>\n')
+    return ''.join(xml_parts)
+
+def render_markdown_questions(questions):
+    """Render the Markdown questions section and the responses heading"""
+    md_parts = ["## Questions\n\n"]
+    for i, question in enumerate(questions):
+        md_parts.append(f"- **Question {i+1}:** {question}\n")
+    md_parts.append("\n")
+    md_parts.append("## Responses\n\n")
+    return ''.join(md_parts)
+
+def render_markdown_respondent(i, answers):
+    """Render one respondent as a Markdown list"""
+    md_parts = [f"### Respondent {i + 1}\n\n"]
+    for answer_key, answer_value in answers.items():
+        formatted_value = format_answer_value(answer_value, "*No answer*")
+        md_parts.append(f"- **{answer_key}:** {formatted_value}\n")
+    md_parts.append("\n")
+    return ''.join(md_parts)
+
+def parse_question_string(question_string):
+    """Parse question string to extract code and description."""
+    if ':' in question_string:
+        parts = question_string.split(':', 1)
+        code = parts[0].strip()
+        desc = parts[1].strip()
+        
+        # Detect question type from description
+        if "[MCQ:" in desc or "[MCQ-Multi:" in desc:
+            return code, desc, "mcq"
+        elif "[Open-ended]" in desc:
+            return code, desc, "open-ended"
+        else:
+            return code, desc, "open-ended"
+    else:
+        return question_string, "", "unknown"
+
+def render_txt_questions(questions):
+    """Render the numbered plain text questions section and the responses heading"""
+    txt_parts = ["Questions:\n"]
+    for i, question in enumerate(questions):
+        question_num = i + 1
+        code, desc, qtype = parse_question_string(question)
+        
+        if qtype == "mcq":
+            txt_parts.append(f"{question_num}. {code}: {desc} (MCQ)\n")
+        else:
+            txt_parts.append(f"{question_num}. {code}: {desc} (Open-ended)\n")
+    
+    txt_parts.append("\nResponses:\n")
+    return ''.join(txt_parts)
+
+def render_txt_respondent(i, answers):
+    """Render one respondent as plain text"""
+    txt_parts = [f"Respondent {i + 1}:\n"]
+    for answer_key, answer_value in answers.items():
+        formatted_value = format_answer_value(answer_value, "(no answer)")
+        txt_parts.append(f"- {answer_key}: {formatted_value}\n")
+    txt_parts.append("\n")
+    return ''.join(txt_parts)
+
+# Output file name, display label, questions renderer and closing text of each format
+_FORMATS = {
+    'html': ('survey_results_sample.html', "HTML", render_html_questions, ""),
+    'xml': ('stack_overflow_questionnaire.xml', "XML", render_xml_questions, '  </responses>\n</questionnaire>\n'),
+    'markdown': ('survey_results_sample.md', "Markdown", render_markdown_questions, ""),
+    'txt': ('survey_results_sample.txt', "TXT", render_txt_questions, "")
+}
+
+def convert_json_to_all(source, output_dir, formats_to_generate):
+    """Convert JSON (a file path or already-loaded data) to the requested formats in a single pass over the responses; returns {format: path}"""
+    formats = [output_format for output_format in _FORMATS if output_format in formats_to_generate]
+    labels = ', '.join(_FORMATS[output_format][1] for output_format in formats)
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_data(source)
         
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
         
-        xml_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
-        xml_content += '<questionnaire>\n'
-        
-        # Add Questions section
-        xml_content += '  <questions>\n'
-        
-        # Helper function to convert to camelCase
-        def to_camel_case(text):
-            words = text.replace("-", " ").replace("_", " ").split()
-            return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
-        
-        # Helper function to extract MCQ options
-        def extract_mcq_options(text):
-            opt_match = re.search(r'MCQ(?:-Multi)?: (.+?)\]', text)
-            if not opt_match:
-                return []
-            opts = opt_match.group(1)
-            # Split by letter markers and clean up
-            options = []
-            parts = re.split(r'\s*([A-Z])\.\s*', opts)
-            for i in range(1, len(parts)-1, 2):
-                letter = parts[i]
-                value = parts[i+1].strip()
-                if value.endswith(' '):
-                    value = value[:-1]
-                options.append((letter, value))
-            return options
-        
-        # Process questions
-        for question in data['questions']:
-            # Parse question string
-            parts = question.split(':', 1)
-            if len(parts) != 2:
-                continue
-                
-            question_key = parts[0].strip()
-            if question_key == "ResponseId":
-                continue  # Skip the response ID
-                
-            # Generate question ID
-            q_id = to_camel_case(question_key)
-            
-            # Extract question type and text
-            question_desc = parts[1].strip()
-            type_match = re.search(r'\[(.*?)\]', question_desc)
-            if type_match:
-                type_str = type_match.group(1)
-                q_text = question_desc.split('[')[0].strip()
-            else:
-                type_str = "Open-ended"
-                q_text = question_desc
-            
-            if "MCQ" in type_str:
-                # MCQ question with options
-                xml_content += f'    <question id="{q_id}" type="mcq">{q_text}\n'
-                options = extract_mcq_options(question_desc)
-                for letter, val in options:
-                    xml_content += f'      <option value="{letter}">{val.strip()}</option>\n'
-                xml_content += '    </question>\n'
-            else:
-                # Open-ended question
-                xml_content += f'    <question id="{q_id}" type="open-ended">{q_text}</question>\n'
-        
-        xml_content += '  </questions>\n'
-        
-        # Add Responses section
-        xml_content += '  <responses>\n'
+        # Start every output with its questions section
+        outputs = {output_format: [_FORMATS[output_format][2](data['questions'])] for output_format in formats}
         
+        # Render each response once into every requested format
+        xml_tags = build_xml_tags(data) if 'xml' in outputs else None
         for i, response in enumerate(data['responses']):
-            xml_content += f'    <respondent id="{i+1}">\n'
-            
-            for answer_key, answer_value in response['answers'].items():
-                if answer_key == "ResponseId":
-                    continue  # Skip the response ID
-                    
-                # Convert key to camelCase for XML
-                xml_key = to_camel_case(answer_key)
-                
-                if isinstance(answer_value, list):
-                    # Handle multi-select answers
-                    xml_content += f'      <{xml_key}>'
-                    xml_content += ','.join(str(v) for v in answer_value)
-                    xml_content += f'</{xml_key}>\n'
-                else:
-                    # Handle single answers
-                    xml_content += f'      <{xml_key}>{answer_value}</{xml_key}>\n'
-            
-            xml_content += '    </respondent>\n'
-        
-        xml_content += '  </responses>\n'
-        xml_content += '</questionnaire>\n'
-        
-        # Save XML file
-        xml_path = os.path.join(output_dir, 'stack_overflow_questionnaire.xml')
-        with open(xml_path, 'w', encoding='utf-8') as f:
-            f.write(xml_content)
-        
-        print(f"✓ XML saved to: {xml_path}")
-        return xml_path
+            answers = response['answers']
+            if 'html' in outputs:
+                outputs['html'].append(render_html_respondent(i, answers))
+            if 'xml' in outputs:
+                outputs['xml'].append(render_xml_respondent(i, answers, xml_tags))
+            if 'markdown' in outputs:
+                outputs['markdown'].append(render_markdown_respondent(i, answers))
+            if 'txt' in outputs:
+                outputs['txt'].append(render_txt_respondent(i, answers))
+        
+        # Save the files
+        paths = {}
+        for output_format, parts in outputs.items():
+            file_name, label, _, closing = _FORMATS[output_format]
+            parts.append(closing)
+            path = os.path.join(output_dir, file_name)
+            # Stream the rendered pieces through a large buffer instead of joining them into one string
+            with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.writelines(parts)
+            print(f"✓ {label} saved to: {path}")
+            paths[output_format] = path
+        return paths
         
     except Exception as e:
-        print(f"Error creating XML: {e}")
-        return None
+        print(f"Error creating {labels}: {e}")
+        return {}
+
+def convert_json_to_html(source, output_dir):
+    """Convert JSON data to HTML format matching the specified structure"""
+    return convert_json_to_all(source, output_dir, ['html']).get('html')
 
-def convert_json_to_markdown(json_path, output_dir):
+def convert_json_to_xml(source, output_dir):
+    """Convert JSON data to structured XML format with detailed question elements."""
+    return convert_json_to_all(source, output_dir, ['xml']).get('xml')
+
+def convert_json_to_markdown(source, output_dir):
     """Convert JSON data to simple Markdown format"""
-    try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        def format_answer_value(value):
-            """Format answer value for display"""
-            if isinstance(value, list):
-                return ", ".join(str(v) for v in value)
-            return str(value) if value is not None else "*No answer*"
-        
-        # Add questions
-        md_content = "## Questions\n\n"
-        for i, question in enumerate(data['questions']):
-            md_content += f"- **Question {i+1}:** {question}\n"
-        md_content += "\n"
-        
-        # Add responses
-        md_content += "## Responses\n\n"
-        for i, response in enumerate(data['responses']):
-            md_content += f"### Respondent {i + 1}\n\n"
-            
-            for answer_key, answer_value in response['answers'].items():
-                formatted_value = format_answer_value(answer_value)
-                md_content += f"- **{answer_key}:** {formatted_value}\n"
-            md_content += "\n"
-        
-        # Save Markdown file
-        md_path = os.path.join(output_dir, 'survey_results_sample.md')
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
-        
-        print(f"✓ Markdown saved to: {md_path}")
-        return md_path
-        
-    except Exception as e:
-        print(f"Error creating Markdown: {e}")
-        return None
+    return convert_json_to_all(source, output_dir, ['markdown']).get('markdown')
 
-def convert_json_to_txt(json_path, output_dir):
+def convert_json_to_txt(source, output_dir):
     """Convert JSON data to structured plain text format with numbered questions and responses."""
-    try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        def format_answer_value(value):
-            """Format answer value for display"""
-            if isinstance(value, list):
-                return ", ".join(str(v) for v in value)
-            return str(value) if value is not None else "(no answer)"
-        
-        def parse_question_string(question_string):
-            """Parse question string to extract code and description."""
-            if ':' in question_string:
-                parts = question_string.split(':', 1)
-                code = parts[0].strip()
-                desc = parts[1].strip()
-                
-                # Detect question type from description
-                if "[MCQ:" in desc or "[MCQ-Multi:" in desc:
-                    return code, desc, "mcq"
-                elif "[Open-ended]" in desc:
-                    return code, desc, "open-ended"
-                else:
-                    return code, desc, "open-ended"
-            else:
-                return question_string, "", "unknown"
-        
-        txt_content = "Questions:\n"
-        
-        # Generate questions section with numbers
-        for i, question in enumerate(data['questions']):
-            question_num = i + 1
-            code, desc, qtype = parse_question_string(question)
-            
-            if qtype == "mcq":
-                txt_content += f"{question_num}. {code}: {desc} (MCQ)\n"
-            else:
-                txt_content += f"{question_num}. {code}: {desc} (Open-ended)\n"
-        
-        # Add responses section
-        txt_content += "\nResponses:\n"
-        
-        for i, response in enumerate(data['responses']):
-            txt_content += f"Respondent {i + 1}:\n"
-            
-            for answer_key, answer_value in response['answers'].items():
-                formatted_value = format_answer_value(answer_value)
-                txt_content += f"- {answer_key}: {formatted_value}\n"
-            txt_content += "\n"
-        
-        # Save TXT file
-        txt_path = os.path.join(output_dir, 'survey_results_sample.txt')
-        with open(txt_path, 'w', encoding='utf-8') as f:
-            f.write(txt_content)
-        
-        print(f"✓ TXT saved to: {txt_path}")
-        return txt_path
-        
-    except Exception as e:
-        print(f"Error creating TXT: {e}")
-        return None
+    return convert_json_to_all(source, output_dir, ['txt']).get('txt')
 
-def convert_to_specific_formats(json_path, output_dir, formats_to_generate):
-    """Convert JSON to specified formats"""
+def convert_to_specific_formats(source, output_dir, formats_to_generate):
+    """Convert JSON (a file path or already-loaded data) to specified formats"""
     print(f"\n=== Converting to requested formats: {', '.join(formats_to_generate)} ===")
     
-    formats_created = []
-    
-    if 'html' in formats_to_generate:
-        # Convert to HTML
-        html_path = convert_json_to_html(json_path, output_dir)
-        if html_path:
-            formats_created.append("HTML")
-    
-    if 'xml' in formats_to_generate:
-        # Convert to XML
-        xml_path = convert_json_to_xml(json_path, output_dir)
-        if xml_path:
-            formats_created.append("XML")
-    
-    if 'markdown' in formats_to_generate:
-        # Convert to Markdown
-        md_path = convert_json_to_markdown(json_path, output_dir)
-        if md_path:
-            formats_created.append("Markdown")
-    
-    if 'txt' in formats_to_generate:
-        # Convert to TXT
-        txt_path = convert_json_to_txt(json_path, output_dir)
-        if txt_path:
-            formats_created.append("TXT")
+    paths = convert_json_to_all(source, output_dir, formats_to_generate)
+    formats_created = [_FORMATS[output_format][1] for output_format in paths]
     
     print(f"\n✓ Successfully created {len(formats_created)} format(s): {', '.join(formats_created)}")
     return formats_created
 
-def convert_to_all_formats(json_path, output_dir):
+def convert_to_all_formats(source, output_dir):
     """Convert JSON to all supported formats"""
-    return convert_to_specific_formats(json_path, output_dir, ['html', 'xml', 'markdown', 'txt'])
+    return convert_to_specific_formats(source, output_dir, list(_FORMATS))
 
 def parse_arguments():
     """Parse command line arguments"""
@@ -632,9 +642,10 @@ if __name__ == "__main__":
         formats_to_generate = ['html', 'xml', 'markdown', 'txt']
     
     # Convert CSV to JSON (always done as base format)
-    json_path = convert_csv_to_json()
+    result = convert_csv_to_json()
     
-    # If JSON conversion was successful, convert to requested formats
-    if json_path:
+    # If JSON conversion was successful, convert the in-memory data to requested formats
+    if result:
+        json_path, data = result
         output_dir = os.path.join('preprocessed_data', 'stack-overflow-2022-developer-survey')
-        convert_to_specific_formats(json_path, output_dir, formats_to_generate)
+        convert_to_specific_formats(data, output_dir, formats_to_generate)
@@ -1,16 +1,32 @@
 import pandas as pd
 import json
-import os
 import argparse
 from pathlib import Path
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from xml.sax.saxutils import escape
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Columns read from the SUS CSV files; id and sus_score are not part of the questionnaire
+CSV_COLUMNS = ['name', 'group'] + [f'sus_{i:02d}' for i in range(1, 11)]
+
+# SUS answers are 1-5 Likert values, so a byte each is enough; the few group labels are stored once as categories
+CSV_DTYPES = {**{column: 'int8' for column in CSV_COLUMNS[2:]}, 'group': 'category'}
 
 def load_and_combine_csv_files():
     """Load both SUS CSV files and combine them"""
     try:
-        # Load both CSV files
-        current_df = pd.read_csv('data/sus-uta7/sus_current.csv')
-        assistant_df = pd.read_csv('data/sus-uta7/sus_assistant.csv')
+        # Load both CSV files at the same time (the pandas parser releases the GIL),
+        # parsing only the columns the questionnaire uses
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            current_future = executor.submit(pd.read_csv, 'data/sus-uta7/sus_current.csv', usecols=CSV_COLUMNS, dtype=CSV_DTYPES)
+            assistant_future = executor.submit(pd.read_csv, 'data/sus-uta7/sus_assistant.csv', usecols=CSV_COLUMNS, dtype=CSV_DTYPES)
+            current_df = current_future.result()
+            assistant_df = assistant_future.result()
         
         print(f"✓ Loaded sus_current.csv: {len(current_df)} responses")
         print(f"✓ Loaded sus_assistant.csv: {len(assistant_df)} responses")
@@ -30,8 +46,8 @@ def load_and_combine_csv_files():
         print(f"Error loading CSV files: {e}")
         return None
 
-def create_json_structure(df):
-    """Convert DataFrame to the specified JSON structure"""
+def create_json_structure(df, columnar=False, verbose=False):
+    """Convert DataFrame to the specified JSON structure (or to column names plus rows of values)"""
     
     # Define the questions with proper type indicators in square brackets
     questions = {
@@ -74,25 +90,47 @@ def create_json_structure(df):
     # Create responses array
     responses = []
     
-    print("Processing responses...")
-    for index, row in df.iterrows():
-        # Convert group to letter code
-        group_code = group_mapping.get(row['group'].lower(), row['group'])
+    # Pull the needed columns out as arrays once instead of building a Series per row
+    names = df['name'].to_numpy()
+    
+    # Convert groups to letter codes for the whole column at once, keeping unknown groups as they are
+    group_codes = df['group'].str.lower().map(group_mapping).fillna(df['group']).to_numpy()
+    
+    # Cast the SUS block once; tolist() hands back plain Python ints ready for JSON
+    sus_rows = df[list(sus_mapping)].to_numpy(dtype='int64').tolist()
+    
+    # Friendly names in the same order as the SUS columns
+    friendly_names = tuple(sus_mapping.values())
+    
+    if columnar:
+        # Name the columns once and keep each response as a plain list of values
+        rows = [[name, group_code, *sus_values] for name, group_code, sus_values in zip(names, group_codes, sus_rows)]
+        json_data = {
+            "questions": questions,
+            "columns": ["name", "group", *friendly_names],
+            "rows": rows
+        }
         
+        print(f"✓ Created columnar JSON structure with {len(rows)} responses")
+        
+        return json_data
+    
+    print("Processing responses...")
+    for index, (name, group_code, sus_values) in enumerate(zip(names, group_codes, sus_rows)):
         response = {
             "answers": {
-                "name": row['name'],
+                "name": name,
                 "group": group_code
             }
         }
         
         # Add SUS responses with mapped names
-        for sus_col, friendly_name in sus_mapping.items():
-            response["answers"][friendly_name] = int(row[sus_col])
+        response["answers"].update(zip(friendly_names, sus_values))
         
         responses.append(response)
         
-        if (index + 1) % 20 == 0:
+        # Progress is only reported on request
+        if verbose and (index + 1) % 20 == 0:
             print(f"  Processed {index + 1} responses...")
     
     # Create the final JSON structure (top-level questions and responses)
@@ -108,19 +146,35 @@ def create_json_structure(df):
 def save_json_file(json_data, output_dir):
     """Save JSON data to file"""
     try:
-        # Create output directory if it doesn't exist
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
-        
-        # Save JSON file
-        json_path = os.path.join(output_dir, 'sus_uta7_questionnaire.json')
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
-        
-        # Calculate file size
-        file_size = os.path.getsize(json_path) / 1024  # KB
+        # Responses are either answer dicts or, in the columnar layout, rows of values
+        records_key = "rows" if "rows" in json_data else "responses"
+        records = json_data[records_key]
+        
+        # Save JSON file; the final write position gives the file size without another stat call
+        json_path = Path(output_dir) / 'sus_uta7_questionnaire.json'
+        if orjson is not None:
+            # orjson serializes in native code straight to UTF-8 bytes, with the same two-space layout
+            with open(json_path, 'wb') as f:
+                f.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+                file_size = f.tell() / 1024  # KB
+        else:
+            # Write one response (or row) at a time, keeping the indented layout of a single json.dump
+            # (JSON strings escape newlines, so re-indenting on '\n' only touches the layout)
+            with open(json_path, 'w', encoding='utf-8') as f:
+                f.write('{')
+                for key in json_data:
+                    if key != records_key:
+                        value_json = json.dumps(json_data[key], indent=2, ensure_ascii=False).replace('\n', '\n  ')
+                        f.write(f'\n  "{key}": {value_json},')
+                f.write(f'\n  "{records_key}": [')
+                for idx, record in enumerate(records):
+                    record_json = json.dumps(record, indent=2, ensure_ascii=False).replace('\n', '\n    ')
+                    f.write(f'{"," if idx else ""}\n    {record_json}')
+                f.write('\n  ]\n}' if records else ']\n}')
+                file_size = f.tell() / 1024  # KB
         
         print(f"✓ JSON saved to: {json_path}")
-        print(f"✓ Total responses: {len(json_data['responses'])}")
+        print(f"✓ Total responses: {len(records)}")
         print(f"✓ File size: {file_size:.1f} KB")
         
         return json_path
@@ -129,7 +183,28 @@ def save_json_file(json_data, output_dir):
         print(f"Error saving JSON: {e}")
         return None
 
-def convert_sus_to_json():
+def expand_rows(data):
+    """Turn columnar data (column names plus rows of values) back into per-respondent answers"""
+    if "rows" not in data:
+        return data
+    columns = data["columns"]
+    return {
+        "questions": data["questions"],
+        "responses": [{"answers": dict(zip(columns, row))} for row in data["rows"]]
+    }
+
+def load_json_data(source):
+    """Return the questionnaire data from a JSON file path, or the dict itself if already loaded"""
+    if isinstance(source, dict):
+        return expand_rows(source)
+    if orjson is not None:
+        # orjson parses straight from bytes and is considerably faster than the json module
+        with open(source, 'rb') as f:
+            return expand_rows(orjson.loads(f.read()))
+    with open(source, 'r', encoding='utf-8') as f:
+        return expand_rows(json.load(f))
+
+def convert_sus_to_json(output_dir, columnar=False, verbose=False):
     """Main function to convert SUS CSV files to JSON"""
     print("=== SUS-UTA7 CSV to JSON Converter ===\n")
     
@@ -145,74 +220,229 @@ def convert_sus_to_json():
     
     # Create JSON structure
     print(f"\n=== Converting to JSON ===")
-    json_data = create_json_structure(df)
+    json_data = create_json_structure(df, columnar, verbose)
     
     # Save JSON file
     print(f"\n=== Saving File ===")
-    output_dir = os.path.join('preprocessed_data', 'sus-uta7')
     json_path = save_json_file(json_data, output_dir)
+    if json_path is None:
+        return None
     
-    return json_path
+    return json_path, json_data
 
-def convert_json_to_html(json_path, output_dir):
-    """Convert JSON data to HTML format matching the specified structure"""
-    try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Start HTML content
-        html_content = "<h1>Questions</h1>\n<ul>\n"
-        
-        # Define Likert scale questions for special formatting
-        likert_questions = {
-            "Frequent usage", "System complexity", "Ease of use", 
-            "Need for technical support", "Integration of functions", 
-            "Inconsistency", "Ease of learning", "Cumbersome to use", 
-            "Confidence in use", "Need to learn before use"
-        }
+# Likert scale questions, given special formatting in the HTML question list
+LIKERT_QUESTIONS = frozenset({
+    "Frequent usage", "System complexity", "Ease of use", 
+    "Need for technical support", "Integration of functions", 
+    "Inconsistency", "Ease of learning", "Cumbersome to use", 
+    "Confidence in use", "Need to learn before use"
+})
+
+# Likert type tag of the SUS questions and its plain-language form in the HTML question list
+_LIKERT_TAG = "[Likert 1–5: 1 = Strongly Disagree, 5 = Strongly Agree]"
+_LIKERT_HTML_SCALE = "(Rate from 1 to 5, where 1 = strongly disagree, 5 = strongly agree)"
+
+# Patterns used to describe the questions in the XML, compiled once
+_QUESTION_TYPE_RE = re.compile(r'\[(.*?)\]')
+_MCQ_BODY_RE = re.compile(r'MCQ: (.+?)\]')
+_MCQ_OPTION_RE = re.compile(r'([A-Z])\. ([^A-Z]+?)(?=(?:[A-Z]\.|$))')
+_LIKERT_SCALE_RE = re.compile(r'Likert (\d+)–(\d+)')
+_RATE_NOTE_RE = re.compile(r'\(Rate.*?\)')
+_SCALE_NOTE_RE = re.compile(r'\(.*?=.*?\)')
+
+def xml_text(value):
+    """Escape &, < and > in text values for XML/HTML element content; numbers pass through"""
+    return escape(value) if isinstance(value, str) else value
+
+def iter_html(data):
+    """Generate the HTML document piece by piece"""
+    # Start HTML content
+    yield "<h1>Questions</h1>\n<ul>\n"
+    
+    # Add questions section with special formatting for Likert questions
+    for question_key, question_desc in data['questions'].items():
+        if question_key in LIKERT_QUESTIONS:
+            # Format Likert scale questions with scale notation
+            formatted_desc = question_desc.replace(_LIKERT_TAG, _LIKERT_HTML_SCALE)
+            yield f"  <li><strong>{xml_text(question_key)}:</strong> {xml_text(formatted_desc)}</li>\n"
+        else:
+            # Regular questions
+            yield f"  <li><strong>{xml_text(question_key)}:</strong> {xml_text(question_desc)}</li>\n"
+    
+    yield "</ul>\n\n"
+    
+    # Add responses section
+    yield "<h1>Responses</h1>\n"
+    
+    # Format the line prefix of every question once; all questions are shown to include missing answers
+    html_prefixes = {question_key: f"  <li><strong>{xml_text(question_key)}:</strong> " for question_key in data['questions']}
+    
+    for i, response in enumerate(data['responses']):
+        yield f"<h2>Respondent {i + 1}</h2>\n"
+        yield "<ul>\n"
         
-        # Add questions section with special formatting for Likert questions
-        for question_key, question_desc in data['questions'].items():
-            if question_key in likert_questions:
-                # Format Likert scale questions with scale notation
-                formatted_desc = question_desc.replace("[Likert 1–5: 1 = Strongly Disagree, 5 = Strongly Agree]", "(Rate from 1 to 5, where 1 = strongly disagree, 5 = strongly agree)")
-                formatted_desc = formatted_desc.replace("[Likert 1–5: 1 = Strongly Disagree, 5 = Strongly Agree]", "(Rate from 1 to 5)")
-                if "(Rate" not in formatted_desc:
-                    formatted_desc += " (Rate from 1 to 5)"
-                html_content += f"  <li><strong>{question_key}:</strong> {formatted_desc}</li>\n"
+        answers = response['answers']
+        for question_key, prefix in html_prefixes.items():
+            answer_value = answers.get(question_key)
+            
+            if answer_value is not None and answer_value != "":
+                yield f"{prefix}{xml_text(answer_value)}</li>\n"
             else:
-                # Regular questions
-                html_content += f"  <li><strong>{question_key}:</strong> {question_desc}</li>\n"
-        
-        html_content += "</ul>\n\n"
+                yield f"{prefix}(missing)</li>\n"
         
-        # Add responses section
-        html_content += "<h1>Responses</h1>\n"
+        yield "</ul>\n\n"
+
+def iter_xml(data):
+    """Generate the XML document piece by piece"""
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<questionnaire>\n'
+    
+    # Add Questions section
+    yield '  <questions>\n'
+    
+    # Helper function to convert to camelCase
+    def to_camel_case(text):
+        words = text.replace("-", " ").replace("_", " ").split()
+        return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
+    
+    # Helper function to extract MCQ options
+    def extract_mcq_options(text):
+        opt_match = _MCQ_BODY_RE.search(text)
+        if not opt_match:
+            return []
+        opts = opt_match.group(1)
+        return _MCQ_OPTION_RE.findall(opts)
+    
+    # Helper function to extract Likert scale
+    def extract_likert_scale(text):
+        scale_match = _LIKERT_SCALE_RE.search(text)
+        if scale_match:
+            start, end = scale_match.groups()
+            return f"{start}-{end}"
+        return None
+    
+    # Process questions
+    for question_key, question_desc in data['questions'].items():
+        # Generate question ID
+        q_id = to_camel_case(question_key)
+        
+        # Extract question type and text
+        type_match = _QUESTION_TYPE_RE.search(question_desc)
+        if type_match:
+            type_str = type_match.group(1)
+            q_text = question_desc.split('[')[0].strip()
+        else:
+            type_str = "Open-ended"
+            q_text = question_desc
+        
+        # Clean up question text
+        if question_key == "name":
+            q_text = "Name of the respondent"
+        elif question_key == "group":
+            q_text = "Group of the respondent"
+        else:
+            # Remove any scale information from the question text
+            q_text = _RATE_NOTE_RE.sub('', q_text).strip()
+            q_text = _SCALE_NOTE_RE.sub('', q_text).strip()
+        
+        if "MCQ" in type_str:
+            # MCQ question with options
+            yield f'    <question id="{q_id}" type="mcq">{xml_text(q_text)}\n'
+            options = extract_mcq_options(question_desc)
+            for letter, val in options:
+                yield f'      <option value="{letter}">{xml_text(val.strip())}</option>\n'
+            yield '    </question>\n'
+        elif "Likert" in type_str:
+            # Likert question with scale
+            scale = extract_likert_scale(type_str)
+            if scale:
+                yield f'    <question id="{q_id}" type="likert" scale="{scale}">{xml_text(q_text)}</question>\n'
+            else:
+                yield f'    <question id="{q_id}" type="likert" scale="1-5">{xml_text(q_text)}</question>\n'
+        else:
+            # Open-ended question
+            yield f'    <question id="{q_id}" type="open-ended">{xml_text(q_text)}</question>\n'
+    
+    yield '  </questions>\n'
+    
+    # Add Responses section
+    yield '  <responses>\n'
+    
+    for i, response in enumerate(data['responses']):
+        yield f'    <respondent id="{i+1}">\n'
         
-        for i, response in enumerate(data['responses']):
-            html_content += f"<h2>Respondent {i + 1}</h2>\n"
-            html_content += "<ul>\n"
+        for answer_key, answer_value in response['answers'].items():
+            # Convert key to camelCase for XML
+            xml_key = to_camel_case(answer_key)
             
-            # Get all question keys to ensure we show missing answers
-            all_question_keys = data['questions'].keys()
-            
-            for question_key in all_question_keys:
-                if question_key in response['answers']:
-                    answer_value = response['answers'][question_key]
-                    
-                    if answer_value is not None and answer_value != "":
-                        html_content += f"  <li><strong>{question_key}:</strong> {answer_value}</li>\n"
-                    else:
-                        html_content += f"  <li><strong>{question_key}:</strong> (missing)</li>\n"
-                else:
-                    html_content += f"  <li><strong>{question_key}:</strong> (missing)</li>\n"
-            
-            html_content += "</ul>\n\n"
+            # Handle single answers
+            yield f'      <{xml_key}>{xml_text(answer_value)}</{xml_key}>\n'
         
-        # Save HTML file
-        html_path = os.path.join(output_dir, 'sus_uta7_questionnaire.html')
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        yield '    </respondent>\n'
+    
+    yield '  </responses>\n'
+    yield '</questionnaire>\n'
+
+def iter_markdown(data):
+    """Generate the Markdown document piece by piece"""
+    # Add questions
+    yield "## Questions\n\n"
+    for question_key, question_desc in data['questions'].items():
+        yield f"- **{question_key}:** {question_desc}\n"
+    yield "\n"
+    
+    # Add responses, with the line prefix of every question formatted once
+    yield "## Responses\n\n"
+    md_prefixes = {question_key: f"- **{question_key}:** " for question_key in data['questions']}
+    for i, response in enumerate(data['responses']):
+        yield f"### Respondent {i + 1}\n\n"
+        
+        for answer_key, answer_value in response['answers'].items():
+            prefix = md_prefixes.get(answer_key) or f"- **{answer_key}:** "
+            if answer_value is not None:
+                yield f"{prefix}{answer_value}\n"
+            else:
+                yield f"{prefix}*No answer*\n"
+        yield "\n"
+
+def iter_txt(data):
+    """Generate the plain text document piece by piece"""
+    yield "Questions:\n"
+    
+    # Generate questions section with numbers
+    question_num = 1
+    for question_key, question_desc in data['questions'].items():
+        # Detect question type based on content
+        if "scale" in question_desc.lower() or "rating" in question_desc.lower():
+            yield f"{question_num}. {question_key}: {question_desc} (Scale/Rating)\n"
+        else:
+            yield f"{question_num}. {question_key}: {question_desc} (Open-ended)\n"
+        question_num += 1
+    
+    # Add responses section, with the line prefix of every question formatted once
+    yield "\nResponses:\n"
+    txt_prefixes = {question_key: f"- {question_key}: " for question_key in data['questions']}
+    
+    for i, response in enumerate(data['responses']):
+        yield f"Respondent {i + 1}:\n"
+        
+        for answer_key, answer_value in response['answers'].items():
+            prefix = txt_prefixes.get(answer_key) or f"- {answer_key}: "
+            if answer_value is not None:
+                yield f"{prefix}{answer_value}\n"
+            else:
+                yield f"{prefix}(no answer)\n"
+        yield "\n"
+
+def convert_json_to_html(source, output_dir):
+    """Convert JSON data to HTML format matching the specified structure"""
+    try:
+        data = load_json_data(source)
+        
+        # Save HTML file, streaming the document as it is generated
+        html_path = Path(output_dir) / 'sus_uta7_questionnaire.html'
+        with open(html_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(iter_html(data))
         
         print(f"✓ HTML saved to: {html_path}")
         return html_path
@@ -221,108 +451,15 @@ def convert_json_to_html(json_path, output_dir):
         print(f"Error creating HTML: {e}")
         return None
 
-def convert_json_to_xml(json_path, output_dir):
+def convert_json_to_xml(source, output_dir):
     """Convert JSON data to structured XML format with detailed question elements."""
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
-        
-        xml_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
-        xml_content += '<questionnaire>\n'
-        
-        # Add Questions section
-        xml_content += '  <questions>\n'
-        
-        # Helper function to convert to camelCase
-        def to_camel_case(text):
-            words = text.replace("-", " ").replace("_", " ").split()
-            return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
-        
-        # Helper function to extract MCQ options
-        def extract_mcq_options(text):
-            opt_match = re.search(r'MCQ: (.+?)\]', text)
-            if not opt_match:
-                return []
-            opts = opt_match.group(1)
-            return re.findall(r'([A-Z])\. ([^A-Z]+?)(?=(?:[A-Z]\.|$))', opts)
-        
-        # Helper function to extract Likert scale
-        def extract_likert_scale(text):
-            scale_match = re.search(r'Likert (\d+)–(\d+)', text)
-            if scale_match:
-                start, end = scale_match.groups()
-                return f"{start}-{end}"
-            return None
-        
-        # Process questions
-        for question_key, question_desc in data['questions'].items():
-            # Generate question ID
-            q_id = to_camel_case(question_key)
-            
-            # Extract question type and text
-            type_match = re.search(r'\[(.*?)\]', question_desc)
-            if type_match:
-                type_str = type_match.group(1)
-                q_text = question_desc.split('[')[0].strip()
-            else:
-                type_str = "Open-ended"
-                q_text = question_desc
-            
-            # Clean up question text
-            if question_key == "name":
-                q_text = "Name of the respondent"
-            elif question_key == "group":
-                q_text = "Group of the respondent"
-            else:
-                # Remove any scale information from the question text
-                q_text = re.sub(r'\(Rate.*?\)', '', q_text).strip()
-                q_text = re.sub(r'\(.*?=.*?\)', '', q_text).strip()
-            
-            if "MCQ" in type_str:
-                # MCQ question with options
-                xml_content += f'    <question id="{q_id}" type="mcq">{q_text}\n'
-                options = extract_mcq_options(question_desc)
-                for letter, val in options:
-                    xml_content += f'      <option value="{letter}">{val.strip()}</option>\n'
-                xml_content += '    </question>\n'
-            elif "Likert" in type_str:
-                # Likert question with scale
-                scale = extract_likert_scale(type_str)
-                if scale:
-                    xml_content += f'    <question id="{q_id}" type="likert" scale="{scale}">{q_text}</question>\n'
-                else:
-                    xml_content += f'    <question id="{q_id}" type="likert" scale="1-5">{q_text}</question>\n'
-            else:
-                # Open-ended question
-                xml_content += f'    <question id="{q_id}" type="open-ended">{q_text}</question>\n'
+        data = load_json_data(source)
         
-        xml_content += '  </questions>\n'
-        
-        # Add Responses section
-        xml_content += '  <responses>\n'
-        
-        for i, response in enumerate(data['responses']):
-            xml_content += f'    <respondent id="{i+1}">\n'
-            
-            for answer_key, answer_value in response['answers'].items():
-                # Convert key to camelCase for XML
-                xml_key = to_camel_case(answer_key)
-                
-                # Handle single answers
-                xml_content += f'      <{xml_key}>{answer_value}</{xml_key}>\n'
-            
-            xml_content += '    </respondent>\n'
-        
-        xml_content += '  </responses>\n'
-        xml_content += '</questionnaire>\n'
-        
-        # Save XML file
-        xml_path = os.path.join(output_dir, 'sus_uta7_questionnaire.xml')
-        with open(xml_path, 'w', encoding='utf-8') as f:
-            f.write(xml_content)
+        # Save XML file, streaming the document as it is generated
+        xml_path = Path(output_dir) / 'sus_uta7_questionnaire.xml'
+        with open(xml_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(iter_xml(data))
         
         print(f"✓ XML saved to: {xml_path}")
         return xml_path
@@ -331,34 +468,15 @@ def convert_json_to_xml(json_path, output_dir):
         print(f"Error creating XML: {e}")
         return None
 
-def convert_json_to_markdown(json_path, output_dir):
+def convert_json_to_markdown(source, output_dir):
     """Convert JSON data to simple Markdown format"""
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Add questions
-        md_content = "## Questions\n\n"
-        for question_key, question_desc in data['questions'].items():
-            md_content += f"- **{question_key}:** {question_desc}\n"
-        md_content += "\n"
-        
-        # Add responses
-        md_content += "## Responses\n\n"
-        for i, response in enumerate(data['responses']):
-            md_content += f"### Respondent {i + 1}\n\n"
-            
-            for answer_key, answer_value in response['answers'].items():
-                if answer_value is not None:
-                    md_content += f"- **{answer_key}:** {answer_value}\n"
-                else:
-                    md_content += f"- **{answer_key}:** *No answer*\n"
-            md_content += "\n"
-        
-        # Save Markdown file
-        md_path = os.path.join(output_dir, 'sus_uta7_questionnaire.md')
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
+        data = load_json_data(source)
+        
+        # Save Markdown file, streaming the document as it is generated
+        md_path = Path(output_dir) / 'sus_uta7_questionnaire.md'
+        with open(md_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(iter_markdown(data))
         
         print(f"✓ Markdown saved to: {md_path}")
         return md_path
@@ -367,41 +485,15 @@ def convert_json_to_markdown(json_path, output_dir):
         print(f"Error creating Markdown: {e}")
         return None
 
-def convert_json_to_txt(json_path, output_dir):
+def convert_json_to_txt(source, output_dir):
     """Convert JSON data to structured plain text format with numbered questions and responses."""
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_data(source)
         
-        txt_content = "Questions:\n"
-        
-        # Generate questions section with numbers
-        question_num = 1
-        for question_key, question_desc in data['questions'].items():
-            # Detect question type based on content
-            if "scale" in question_desc.lower() or "rating" in question_desc.lower():
-                txt_content += f"{question_num}. {question_key}: {question_desc} (Scale/Rating)\n"
-            else:
-                txt_content += f"{question_num}. {question_key}: {question_desc} (Open-ended)\n"
-            question_num += 1
-        
-        # Add responses section
-        txt_content += "\nResponses:\n"
-        
-        for i, response in enumerate(data['responses']):
-            txt_content += f"Respondent {i + 1}:\n"
-            
-            for answer_key, answer_value in response['answers'].items():
-                if answer_value is not None:
-                    txt_content += f"- {answer_key}: {answer_value}\n"
-                else:
-                    txt_content += f"- {answer_key}: (no answer)\n"
-            txt_content += "\n"
-        
-        # Save TXT file
-        txt_path = os.path.join(output_dir, 'sus_uta7_questionnaire.txt')
-        with open(txt_path, 'w', encoding='utf-8') as f:
-            f.write(txt_content)
+        # Save TXT file, streaming the document as it is generated
+        txt_path = Path(output_dir) / 'sus_uta7_questionnaire.txt'
+        with open(txt_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(iter_txt(data))
         
         print(f"✓ TXT saved to: {txt_path}")
         return txt_path
@@ -410,42 +502,41 @@ def convert_json_to_txt(json_path, output_dir):
         print(f"Error creating TXT: {e}")
         return None
 
-def convert_to_specific_formats(json_path, output_dir, formats_to_generate):
-    """Convert JSON to specified formats"""
+_FORMAT_CONVERTERS = {
+    'html': ("HTML", convert_json_to_html),
+    'xml': ("XML", convert_json_to_xml),
+    'markdown': ("Markdown", convert_json_to_markdown),
+    'txt': ("TXT", convert_json_to_txt)
+}
+
+def convert_to_specific_formats(source, output_dir, formats_to_generate):
+    """Convert JSON (a file path or already-loaded data) to specified formats"""
     print(f"\n=== Converting to requested formats: {', '.join(formats_to_generate)} ===")
     
-    formats_created = []
-    
-    if 'html' in formats_to_generate:
-        # Convert to HTML
-        html_path = convert_json_to_html(json_path, output_dir)
-        if html_path:
-            formats_created.append("HTML")
-    
-    if 'xml' in formats_to_generate:
-        # Convert to XML
-        xml_path = convert_json_to_xml(json_path, output_dir)
-        if xml_path:
-            formats_created.append("XML")
+    # Parse the JSON once (if not already in memory) and share it between the converters
+    try:
+        data = load_json_data(source)
+    except Exception as e:
+        print(f"Error reading JSON: {e}")
+        return []
     
-    if 'markdown' in formats_to_generate:
-        # Convert to Markdown
-        md_path = convert_json_to_markdown(json_path, output_dir)
-        if md_path:
-            formats_created.append("Markdown")
+    # Each converter writes its own file from the same data; the rendering is pure Python,
+    # so separate processes let the formats run on separate cores
+    with ProcessPoolExecutor(max_workers=len(_FORMAT_CONVERTERS)) as executor:
+        futures = [
+            (format_name, executor.submit(converter, data, output_dir))
+            for format_key, (format_name, converter) in _FORMAT_CONVERTERS.items()
+            if format_key in formats_to_generate
+        ]
     
-    if 'txt' in formats_to_generate:
-        # Convert to TXT
-        txt_path = convert_json_to_txt(json_path, output_dir)
-        if txt_path:
-            formats_created.append("TXT")
+    formats_created = [format_name for format_name, future in futures if future.result()]
     
     print(f"\n✓ Successfully created {len(formats_created)} format(s): {', '.join(formats_created)}")
     return formats_created
 
-def convert_to_all_formats(json_path, output_dir):
+def convert_to_all_formats(source, output_dir):
     """Convert JSON to all supported formats"""
-    return convert_to_specific_formats(json_path, output_dir, ['html', 'xml', 'markdown', 'txt'])
+    return convert_to_specific_formats(source, output_dir, list(_FORMAT_CONVERTERS))
 
 def parse_arguments():
     """Parse command line arguments"""
@@ -457,6 +548,8 @@ def parse_arguments():
     parser.add_argument('--markdown', action='store_true', help='Generate Markdown format')
     parser.add_argument('--txt', action='store_true', help='Generate raw text format')
     parser.add_argument('--all', action='store_true', help='Generate all formats')
+    parser.add_argument('--verbose', action='store_true', help='Report progress while building the responses')
+    parser.add_argument('--columnar', action='store_true', help='Save the JSON as column names plus one row of values per response')
     
     return parser.parse_args()
 
@@ -464,17 +557,21 @@ if __name__ == "__main__":
     # Parse command line arguments
     args = parse_arguments()
     
+    # Create the output directory once for the JSON file and every other format
+    output_dir = Path('preprocessed_data') / 'sus-uta7'
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
     # Convert CSV to JSON (always done as base format)
-    json_path = convert_sus_to_json()
+    result = convert_sus_to_json(output_dir, args.columnar, args.verbose)
     
-    # If JSON conversion was successful, convert to requested formats
-    if json_path:
-        output_dir = os.path.join('preprocessed_data', 'sus-uta7')
+    # If JSON conversion was successful, convert the in-memory data to requested formats
+    if result:
+        json_path, json_data = result
         
         # Determine which formats to generate
         if args.all:
             # Generate all formats
-            convert_to_all_formats(json_path, output_dir)
+            convert_to_all_formats(json_data, output_dir)
         else:
             # Generate specific formats
             formats_to_generate = []
@@ -492,4 +589,4 @@ if __name__ == "__main__":
             if not formats_to_generate:
                 formats_to_generate = ['html', 'xml', 'markdown', 'txt']
             
-            convert_to_specific_formats(json_path, output_dir, formats_to_generate)
+            convert_to_specific_formats(json_data, output_dir, formats_to_generate)